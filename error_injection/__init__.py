@@ -31,4 +31,5 @@ from .mcp_registry import (
     get_mcp_catalog_for_category,
     get_mcp_info,
     get_alternative_mcp,
+    get_servers_by_category,
 )
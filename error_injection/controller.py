@@ -1,17 +1,100 @@
 # Error Injection Controller - Wraps mock APIs, injects failures on first call
 # Uses obfuscated tool names and vague error messages for all difficulty levels
 
+import functools
 import inspect
 import random
+import sys
+import types
+import weakref
 
+from .mcp_registry import get_mcp_catalog_for_category, is_combined_server
 from .tool_obfuscation import DECOY_TOOLS
 
 
+# Signatures of guarded methods, keyed weakly on the underlying function (not the
+# bound method, which is rebuilt on every attribute access). Scenarios rebuild the
+# same wrappers over and over, so compute each once.
+_SIGNATURE_CACHE = weakref.WeakKeyDictionary()
+
+# Decoy tools partitioned by service prefix (e.g., "gh", "slk"), built once at import
+_DECOYS_BY_PREFIX = {}
+for _decoy_name, _decoy_info in DECOY_TOOLS.items():
+    _DECOYS_BY_PREFIX.setdefault(_decoy_name.split("_", 1)[0], []).append(
+        (_decoy_name, (_decoy_info["description"], _decoy_info["response"]))
+    )
+_DECOYS_BY_PREFIX = {prefix: tuple(decoys) for prefix, decoys in _DECOYS_BY_PREFIX.items()}
+del _decoy_name, _decoy_info
+
+
+def _iter_public_methods(api):
+    """
+    Yield (name, bound_method) for every public method defined on the API's class.
+    Walks the class MRO directly, so only plain functions are picked up and no
+    per-attribute callable() probing is needed.
+    """
+    seen = set()
+    for cls in type(api).__mro__:
+        if cls is object:
+            break
+        for name, value in cls.__dict__.items():
+            if name.startswith("_") or name in seen:
+                continue
+            if isinstance(value, types.FunctionType):
+                seen.add(name)
+                yield name, getattr(api, name)
+
+
+# (api type, prefix, name map id) -> tuple of (original_name, obfuscated_name)
+_NAME_PAIR_CACHE = {}
+
+
+def _resolve_name_pairs(api, prefix: str, name_map: dict) -> tuple:
+    """
+    Resolve the (original_name, obfuscated_name) pairs for an API's public methods.
+    Results for the static *_NAME_MAP tables are cached per API type, so repeat
+    constructions skip the method scan and default-name formatting.
+    """
+    cacheable = id(name_map) in _STATIC_NAME_MAP_IDS
+    key = (type(api), prefix, id(name_map))
+    if cacheable:
+        pairs = _NAME_PAIR_CACHE.get(key)
+        if pairs is not None:
+            return pairs
+
+    pairs = tuple(
+        (name, name_map.get(name, f"{prefix}_{name}"))
+        for name, _ in _iter_public_methods(api)
+    )
+
+    if cacheable:
+        _NAME_PAIR_CACHE[key] = pairs
+    return pairs
+
+
+def _scenario_loaders(*apis) -> tuple:
+    """Collect the bound _load_scenario methods of the given APIs that have one."""
+    loaders = (getattr(api, "_load_scenario", None) for api in apis)
+    return tuple(loader for loader in loaders if callable(loader))
+
+
+def _decoy_call(response, /, **kwargs):
+    return dict(response)
+
+
+def _make_decoy(info: tuple):
+    """Build a decoy tool from a DECOY_TOOLS (description, response) entry."""
+    description, response = info
+    decoy_method = functools.partial(_decoy_call, response)
+    decoy_method.__doc__ = description
+    return decoy_method
+
+
 # =============================================================================
 # Vague error messages - don't clearly indicate "switch services"
 # =============================================================================
 
-VAGUE_ERRORS = [
+VAGUE_ERRORS = (
     {"code": "E_UPSTREAM_TIMEOUT", "message": "Request timed out after 30000ms. The upstream service did not respond in time.", "retry_after": None},
     {"code": "E_RESOURCE_EXHAUSTED", "message": "Resource quota exceeded. Daily limit reached for this endpoint.", "retry_after": "86400s"},
     {"code": "E_MAINTENANCE_WINDOW", "message": "Service temporarily unavailable due to scheduled maintenance.", "retry_after": "3600s"},
@@ -22,13 +105,14 @@ VAGUE_ERRORS = [
     {"code": "E_SERVICE_DEGRADED", "message": "Service is experiencing degraded performance. Some features may be unavailable.", "retry_after": None},
     {"code": "E_CAPACITY_EXCEEDED", "message": "Server capacity exceeded. Request queued for later processing.", "retry_after": "300s"},
     {"code": "E_DEPENDENCY_FAILED", "message": "A downstream dependency failed to respond. Please try again later.", "retry_after": None},
-]
+)
 
 
 def get_vague_error() -> dict:
     """Return a random vague error message."""
+    # VAGUE_ERRORS is shared with hard mode - hand out a copy
     error = random.choice(VAGUE_ERRORS)
-    return {"error": error}
+    return {"error": dict(error)}
 
 
 class ObfuscatedPairedAPI:
@@ -56,40 +140,28 @@ class ObfuscatedPairedAPI:
         self.name_map_b = name_map_b
 
         # Bind methods from API A with obfuscated names
-        for name, method in inspect.getmembers(api_a, predicate=inspect.ismethod):
-            if name.startswith("_"):
-                continue
-            obfuscated = name_map_a.get(name, f"{prefix_a}_{name}")
-            setattr(self, obfuscated, method)
+        for name, obfuscated in _resolve_name_pairs(api_a, prefix_a, name_map_a):
+            setattr(self, obfuscated, getattr(api_a, name))
 
         # Bind methods from API B with obfuscated names
-        for name, method in inspect.getmembers(api_b, predicate=inspect.ismethod):
-            if name.startswith("_"):
-                continue
-            obfuscated = name_map_b.get(name, f"{prefix_b}_{name}")
-            setattr(self, obfuscated, method)
+        for name, obfuscated in _resolve_name_pairs(api_b, prefix_b, name_map_b):
+            setattr(self, obfuscated, getattr(api_b, name))
 
         # Add decoy tools
         self._add_decoys(prefix_a)
         self._add_decoys(prefix_b)
 
+        self._scenario_loaders = _scenario_loaders(api_a, api_b)
+
     def _add_decoys(self, prefix: str):
         """Add decoy tools that return useless responses."""
-        for decoy_name, decoy_info in DECOY_TOOLS.items():
-            if decoy_name.startswith(prefix):
-                def make_decoy(info):
-                    def decoy_method(**kwargs):
-                        return info["response"]
-                    decoy_method.__doc__ = info["description"]
-                    return decoy_method
-                setattr(self, decoy_name, make_decoy(decoy_info))
+        for decoy_name, decoy_info in _DECOYS_BY_PREFIX.get(prefix, ()):
+            setattr(self, decoy_name, _make_decoy(decoy_info))
 
     def _load_scenario(self, scenario: dict):
         """Load scenario into both APIs."""
-        if hasattr(self.api_a, '_load_scenario'):
-            self.api_a._load_scenario(scenario)
-        if hasattr(self.api_b, '_load_scenario'):
-            self.api_b._load_scenario(scenario)
+        for loader in self._scenario_loaders:
+            loader(scenario)
 
 
 class ErrorInjectedAPI:
@@ -102,28 +174,71 @@ class ErrorInjectedAPI:
         """
         Args:
             api: The underlying mock API instance.
-            fail_methods (list): List of method names that can fail.
+            fail_methods (iterable): Method names that can fail. A frozenset is used as-is.
         """
         self.api = api
-        self.fail_methods = set(fail_methods)
+        self.fail_methods = fail_methods if isinstance(fail_methods, frozenset) else frozenset(fail_methods)
         self.permanently_failed_methods = set()  # Methods that always fail
         self.first_failure_recorded = False
 
-        # Bind ALL public methods from the underlying API
-        for name in dir(self.api):
-            if name.startswith("_"):
+        # Group fail methods by service prefix (e.g., "gh_", "gl_", "slk_", "dsc_")
+        # so the first failure can condemn a whole service in one lookup
+        self._method_prefix = {m: m.split("_", 1)[0] + "_" for m in self.fail_methods}
+        buckets = {}
+        for m, prefix in self._method_prefix.items():
+            buckets.setdefault(prefix, set()).add(m)
+        self._prefix_buckets = {prefix: frozenset(ms) for prefix, ms in buckets.items()}
+
+        # Bind ALL public methods from the underlying API: instance-bound tools
+        # first, then the class
+        for name, attr in list(getattr(self.api, "__dict__", {}).items()):
+            if name.startswith("_") or not callable(attr):
                 continue
-            attr = getattr(self.api, name)
-            if not callable(attr):
-                continue
-            if name in self.fail_methods:
-                setattr(self, name, self._make_guarded_method(name, attr))
-            else:
-                setattr(self, name, attr)
+            self._bind_tool(name, attr)
+
+        for klass in type(self.api).__mro__:
+            if klass is object:
+                break
+            for name in klass.__dict__:
+                if name.startswith("_") or name in self.__dict__:
+                    continue
+                attr = getattr(self.api, name, None)
+                if callable(attr):
+                    self._bind_tool(name, attr)
+
+    def _bind_tool(self, name, attr):
+        """Expose a tool, guarding it if it belongs to a fail-able method."""
+        name = sys.intern(name)
+        if name in self.fail_methods:
+            setattr(self, name, self._make_guarded_method(name, attr))
+        else:
+            setattr(self, name, attr)
 
     def _make_guarded_method(self, method_name, original_method):
         """Wrapper that permanently fails the first service tried."""
+        key = getattr(original_method, "__func__", original_method)
+        try:
+            sig = _SIGNATURE_CACHE.get(key)
+        except TypeError:  # not weak-referenceable
+            key, sig = None, None
+        if sig is None:
+            try:
+                sig = inspect.signature(original_method)
+            except (ValueError, TypeError):
+                pass
+            else:
+                if key is not None:
+                    _SIGNATURE_CACHE[key] = sig
+
+        healthy = False
+
         def wrapper(*args, **kwargs):
+            nonlocal healthy
+            # Once this method has gone through it can never fail again, so
+            # skip the failure bookkeeping on every later call
+            if healthy:
+                return original_method(*args, **kwargs)
+
             # If this method is in the permanently failed set, always fail
             if method_name in self.permanently_failed_methods:
                 return get_vague_error()
@@ -132,21 +247,16 @@ class ErrorInjectedAPI:
             if not self.first_failure_recorded:
                 self.first_failure_recorded = True
                 # Mark ALL methods from this service as permanently failed
-                # Detect service by prefix (e.g., "gh_", "gl_", "slk_", "dsc_")
-                prefix = method_name.split("_")[0] + "_"
-                for m in self.fail_methods:
-                    if m.startswith(prefix):
-                        self.permanently_failed_methods.add(m)
+                self.permanently_failed_methods |= self._prefix_buckets[self._method_prefix[method_name]]
                 return get_vague_error()
 
             # Otherwise, this is the alternative service - let it work
+            healthy = True
             return original_method(*args, **kwargs)
 
         wrapper.__doc__ = original_method.__doc__
-        try:
-            wrapper.__signature__ = inspect.signature(original_method)
-        except (ValueError, TypeError):
-            pass
+        if sig is not None:
+            wrapper.__signature__ = sig
         wrapper.__name__ = method_name
         return wrapper
 
@@ -266,11 +376,92 @@ DOORDASH_NAME_MAP = {
     "doordash_authenticate": "dd_auth_handshake",
 }
 
+# Old food delivery method names -> obfuscated names, in binding order
+_FOOD_METHOD_MAP = tuple((sys.intern(old), sys.intern(new)) for old, new in (
+    ("ubereats_login", "ue_session_init"),
+    ("ubereats_search_restaurants", "ue_vendor_discover"),
+    ("ubereats_get_menu", "ue_catalog_fetch"),
+    ("ubereats_place_order", "ue_transaction_submit"),
+    ("ubereats_get_order_status", "ue_fulfillment_track"),
+    ("doordash_authenticate", "dd_auth_handshake"),
+    ("doordash_find_restaurants", "dd_merchant_search"),
+    ("doordash_view_menu", "dd_offerings_list"),
+    ("doordash_submit_order", "dd_checkout_complete"),
+    ("doordash_check_order_status", "dd_delivery_status"),
+))
+
+# Identities of the module-level maps above; only these are safe to cache on
+_STATIC_NAME_MAP_IDS = frozenset(id(m) for m in (
+    GITHUB_NAME_MAP, GITLAB_NAME_MAP,
+    SLACK_NAME_MAP, DISCORD_NAME_MAP,
+    GOOGLE_MAPS_NAME_MAP, MAPBOX_NAME_MAP,
+    BRAVE_NAME_MAP, EXA_NAME_MAP,
+    UBEREATS_NAME_MAP, DOORDASH_NAME_MAP,
+))
+
+
+class ObfuscatedFoodAPI:
+    """
+    Obfuscates the combined UberEats/DoorDash API, which is already paired
+    internally. Also injects the ue/dd decoy tools.
+    """
+
+    def __init__(self, api):
+        self.api = api
+
+        # Map old names to new obfuscated names
+        for old_name, new_name in _FOOD_METHOD_MAP:
+            method = getattr(api, old_name, None)
+            if method is not None:
+                setattr(self, new_name, method)
+
+        # Add decoys
+        for prefix in ("ue", "dd"):
+            for decoy_name, decoy_info in _DECOYS_BY_PREFIX.get(prefix, ()):
+                setattr(self, decoy_name, _make_decoy(decoy_info))
+
+        self._scenario_loaders = _scenario_loaders(api)
+
+    def _load_scenario(self, scenario):
+        for loader in self._scenario_loaders:
+            loader(scenario)
+
 
 # =============================================================================
 # Factory functions with obfuscation and vague errors
 # =============================================================================
 
+# Fail-able tools per factory, shared across every wrapper built from them
+_CODE_HOSTING_FAIL_METHODS = frozenset(map(sys.intern, [
+    "gh_ticket_submit", "gl_workitem_new",
+    "gh_changeset_propose", "gl_diff_request",
+    "gh_project_lookup", "gl_namespace_query",
+    "gh_repo_duplicate", "gl_project_fork",
+]))
+
+_TEAM_MESSAGING_FAIL_METHODS = frozenset(map(sys.intern, [
+    "slk_broadcast_text", "dsc_chat_post",
+    "slk_emoji_attach", "dsc_emote_add",
+    "slk_timeline_fetch", "dsc_log_retrieve",
+]))
+
+_MAPS_FAIL_METHODS = frozenset(map(sys.intern, [
+    "gmap_path_calculate", "mbx_route_compute",
+    "gmap_coords_resolve", "mbx_location_encode",
+    "gmap_poi_query", "mbx_feature_search",
+]))
+
+_WEB_SEARCH_FAIL_METHODS = frozenset(map(sys.intern, [
+    "brv_index_query", "exa_corpus_search",
+    "exa_codebase_query", "exa_org_intelligence",
+]))
+
+_FOOD_DELIVERY_FAIL_METHODS = frozenset(map(sys.intern, [
+    "ue_transaction_submit", "dd_checkout_complete",
+    "ue_fulfillment_track", "dd_delivery_status",
+]))
+
+
 def make_error_injected_code_hosting(github_api, gitlab_api):
     """Create code hosting API with obfuscated names and vague errors."""
     paired = ObfuscatedPairedAPI(
@@ -278,14 +469,7 @@ def make_error_injected_code_hosting(github_api, gitlab_api):
         GITHUB_NAME_MAP, GITLAB_NAME_MAP
     )
 
-    fail_methods = [
-        "gh_ticket_submit", "gl_workitem_new",
-        "gh_changeset_propose", "gl_diff_request",
-        "gh_project_lookup", "gl_namespace_query",
-        "gh_repo_duplicate", "gl_project_fork",
-    ]
-
-    return ErrorInjectedAPI(paired, fail_methods)
+    return ErrorInjectedAPI(paired, _CODE_HOSTING_FAIL_METHODS)
 
 
 def make_error_injected_team_messaging(slack_api, discord_api):
@@ -295,13 +479,7 @@ def make_error_injected_team_messaging(slack_api, discord_api):
         SLACK_NAME_MAP, DISCORD_NAME_MAP
     )
 
-    fail_methods = [
-        "slk_broadcast_text", "dsc_chat_post",
-        "slk_emoji_attach", "dsc_emote_add",
-        "slk_timeline_fetch", "dsc_log_retrieve",
-    ]
-
-    return ErrorInjectedAPI(paired, fail_methods)
+    return ErrorInjectedAPI(paired, _TEAM_MESSAGING_FAIL_METHODS)
 
 
 def make_error_injected_maps(google_maps_api, mapbox_api):
@@ -311,13 +489,7 @@ def make_error_injected_maps(google_maps_api, mapbox_api):
         GOOGLE_MAPS_NAME_MAP, MAPBOX_NAME_MAP
     )
 
-    fail_methods = [
-        "gmap_path_calculate", "mbx_route_compute",
-        "gmap_coords_resolve", "mbx_location_encode",
-        "gmap_poi_query", "mbx_feature_search",
-    ]
-
-    return ErrorInjectedAPI(paired, fail_methods)
+    return ErrorInjectedAPI(paired, _MAPS_FAIL_METHODS)
 
 
 def make_error_injected_web_search(brave_api, exa_api):
@@ -327,63 +499,16 @@ def make_error_injected_web_search(brave_api, exa_api):
         BRAVE_NAME_MAP, EXA_NAME_MAP
     )
 
-    fail_methods = [
-        "brv_index_query", "exa_corpus_search",
-        "exa_codebase_query", "exa_org_intelligence",
-    ]
-
-    return ErrorInjectedAPI(paired, fail_methods)
+    return ErrorInjectedAPI(paired, _WEB_SEARCH_FAIL_METHODS)
 
 
 def make_error_injected_food_delivery(food_api):
     """Create food delivery API with obfuscated names and vague errors."""
     # Food delivery is already a paired API internally, so we handle it differently
     # We need to wrap it with obfuscation
-
-    class ObfuscatedFoodAPI:
-        def __init__(self, api):
-            self.api = api
-            # Map old names to new obfuscated names
-            method_map = {
-                "ubereats_login": "ue_session_init",
-                "ubereats_search_restaurants": "ue_vendor_discover",
-                "ubereats_get_menu": "ue_catalog_fetch",
-                "ubereats_place_order": "ue_transaction_submit",
-                "ubereats_get_order_status": "ue_fulfillment_track",
-                "doordash_authenticate": "dd_auth_handshake",
-                "doordash_find_restaurants": "dd_merchant_search",
-                "doordash_view_menu": "dd_offerings_list",
-                "doordash_submit_order": "dd_checkout_complete",
-                "doordash_check_order_status": "dd_delivery_status",
-            }
-
-            for old_name, new_name in method_map.items():
-                if hasattr(api, old_name):
-                    method = getattr(api, old_name)
-                    setattr(self, new_name, method)
-
-            # Add decoys
-            for decoy_name, decoy_info in DECOY_TOOLS.items():
-                if decoy_name.startswith("ue_") or decoy_name.startswith("dd_"):
-                    def make_decoy(info):
-                        def decoy_method(**kwargs):
-                            return info["response"]
-                        decoy_method.__doc__ = info["description"]
-                        return decoy_method
-                    setattr(self, decoy_name, make_decoy(decoy_info))
-
-        def _load_scenario(self, scenario):
-            if hasattr(self.api, '_load_scenario'):
-                self.api._load_scenario(scenario)
-
     obfuscated = ObfuscatedFoodAPI(food_api)
 
-    fail_methods = [
-        "ue_transaction_submit", "dd_checkout_complete",
-        "ue_fulfillment_track", "dd_delivery_status",
-    ]
-
-    return ErrorInjectedAPI(obfuscated, fail_methods)
+    return ErrorInjectedAPI(obfuscated, _FOOD_DELIVERY_FAIL_METHODS)
 
 
 # =============================================================================
@@ -397,6 +522,11 @@ class MCPMountingSystem:
     Only ONE server can be mounted at a time (except for combined servers).
     """
 
+    __slots__ = (
+        "server_apis", "category", "mounted_server", "mounted_api", "failed_servers",
+        "_tools_cache", "_mount_listing_cache", "_method_table_cache", "catalog", "is_combined_server",
+    )
+
     def __init__(self, server_apis: dict, category: str):
         """
         Args:
@@ -409,8 +539,12 @@ class MCPMountingSystem:
         self.mounted_api = None
         self.failed_servers = set()  # Track which servers have failed
 
-        # Import here to avoid circular imports
-        from .mcp_registry import get_mcp_catalog_for_category, is_combined_server
+        # Tool listings per mounted API, keyed by id() - the APIs live in
+        # server_apis for our whole lifetime and their tools never change
+        self._tools_cache = {}
+        self._mount_listing_cache = {}
+        self._method_table_cache = {}
+
         self.catalog = get_mcp_catalog_for_category(category)
         self.is_combined_server = is_combined_server
 
@@ -448,19 +582,20 @@ class MCPMountingSystem:
         self.mounted_server = server_id
         self.mounted_api = self.server_apis[server_id][0]
 
-        # Get list of available tools (methods) on this server
-        tools = []
-        for name in dir(self.mounted_api):
-            if name.startswith("_"):
-                continue
-            attr = getattr(self.mounted_api, name)
-            if callable(attr):
+        # The tool listing only depends on the server and its (fixed) tools;
+        # the response itself is rebuilt so callers never share mutable state
+        key = (server_id, id(self.mounted_api))
+        listing = self._mount_listing_cache.get(key)
+        if listing is None:
+            listing = []
+            for name, attr in self.get_current_tools():
                 doc = getattr(attr, '__doc__', None) or "No description available"
-                tools.append({
-                    "tool_name": name,
-                    "description": doc[:100] + "..." if len(doc) > 100 else doc,
-                })
+                if len(doc) > 100:
+                    doc = doc[:100] + "..."
+                listing.append((name, doc))
+            self._mount_listing_cache[key] = listing = tuple(listing)
 
+        tools = [{"tool_name": name, "description": doc} for name, doc in listing]
         return {
             "status": "mounted",
             "server_id": server_id,
@@ -494,24 +629,34 @@ class MCPMountingSystem:
         if self.mounted_api is None:
             return []
 
-        tools = []
-        for name in dir(self.mounted_api):
-            if name.startswith("_"):
-                continue
-            attr = getattr(self.mounted_api, name)
-            if callable(attr):
-                tools.append((name, attr))
-        return tools
+        key = id(self.mounted_api)
+        tools = self._tools_cache.get(key)
+        if tools is None:
+            tools = []
+            for name in dir(self.mounted_api):
+                if name.startswith("_"):
+                    continue
+                attr = getattr(self.mounted_api, name)
+                if callable(attr):
+                    tools.append((name, attr))
+            self._tools_cache[key] = tools
+        return list(tools)
 
     def call_tool(self, tool_name: str, **kwargs):
         """Call a tool on the mounted server."""
         if self.mounted_api is None:
             return {"error": "No server is mounted. Use mcp_mount(server_id) first."}
 
-        if not hasattr(self.mounted_api, tool_name):
+        key = id(self.mounted_api)
+        table = self._method_table_cache.get(key)
+        if table is None:
+            table = dict(self.get_current_tools())
+            self._method_table_cache[key] = table
+
+        method = table.get(tool_name)
+        if method is None:
             return {"error": f"Tool '{tool_name}' not found on server '{self.mounted_server}'."}
 
-        method = getattr(self.mounted_api, tool_name)
         return method(**kwargs)
 
 
@@ -521,6 +666,8 @@ class MountableErrorInjectedAPI:
     First server mounted and used will permanently fail.
     """
 
+    __slots__ = ("mounting", "fail_prefixes", "failed_prefix", "first_failure_recorded", "_fail_prefix_lookup")
+
     def __init__(self, mounting_system: MCPMountingSystem, fail_prefixes: list):
         """
         Args:
@@ -532,6 +679,9 @@ class MountableErrorInjectedAPI:
         self.failed_prefix = None  # The prefix that permanently fails
         self.first_failure_recorded = False
 
+        # Map each prefix's leading token (e.g., "gh") back to the prefix itself
+        self._fail_prefix_lookup = {p.rstrip("_"): p for p in fail_prefixes}
+
     def mcp_list_servers(self) -> dict:
         return self.mounting.mcp_list_servers()
 
@@ -544,19 +694,19 @@ class MountableErrorInjectedAPI:
     def call_tool(self, tool_name: str, **kwargs):
         """Call a tool with error injection."""
         # Check if this tool's prefix has failed
-        for prefix in self.fail_prefixes:
-            if tool_name.startswith(prefix):
-                if self.failed_prefix == prefix:
-                    # This prefix is permanently failed
-                    return get_vague_error()
-
-                if not self.first_failure_recorded:
-                    # First call to a fail-able tool - mark this prefix as failed
-                    self.first_failure_recorded = True
-                    self.failed_prefix = prefix
-                    # Mark the server as failed in mounting system
-                    self.mounting.mark_server_failed(self.mounting.mounted_server)
-                    return get_vague_error()
+        prefix = self._fail_prefix_lookup.get(tool_name.split("_", 1)[0])
+        if prefix is not None:
+            if self.failed_prefix == prefix:
+                # This prefix is permanently failed
+                return get_vague_error()
+
+            if not self.first_failure_recorded:
+                # First call to a fail-able tool - mark this prefix as failed
+                self.first_failure_recorded = True
+                self.failed_prefix = prefix
+                # Mark the server as failed in mounting system
+                self.mounting.mark_server_failed(self.mounting.mounted_server)
+                return get_vague_error()
 
         # Not a failed prefix, call normally
         return self.mounting.call_tool(tool_name, **kwargs)
@@ -575,20 +725,16 @@ class PairedServerAPI:
         self.prefix_a = prefix_a
         self.prefix_b = prefix_b
 
-        for name, method in inspect.getmembers(api_a, predicate=inspect.ismethod):
-            if name.startswith("_"):
-                continue
+        for name, method in _iter_public_methods(api_a):
             prefixed_name = f"{prefix_a}_{name}"
             setattr(self, prefixed_name, method)
 
-        for name, method in inspect.getmembers(api_b, predicate=inspect.ismethod):
-            if name.startswith("_"):
-                continue
+        for name, method in _iter_public_methods(api_b):
             prefixed_name = f"{prefix_b}_{name}"
             setattr(self, prefixed_name, method)
 
+        self._scenario_loaders = _scenario_loaders(api_a, api_b)
+
     def _load_scenario(self, scenario: dict):
-        if hasattr(self.api_a, '_load_scenario'):
-            self.api_a._load_scenario(scenario)
-        if hasattr(self.api_b, '_load_scenario'):
-            self.api_b._load_scenario(scenario)
+        for loader in self._scenario_loaders:
+            loader(scenario)
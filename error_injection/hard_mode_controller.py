@@ -2,43 +2,72 @@
 # Uses obscured tool names, vague errors, decoy tools, and MCP mounting
 # Designed to achieve ~30% success rate
 
-import inspect
 import random
-from typing import Dict, Any, List
-
-from .tool_obfuscation import (
-    TOOL_NAME_MAPPINGS,
-    DECOY_TOOLS,
-    get_obscured_name,
-    get_decoy_response,
-    get_decoy_description,
-)
-from .mcp_registry import (
-    MCP_SERVER_CATALOG,
-    get_mcp_catalog_description,
-    get_alternative_mcp,
-)
-
-
-# Vague error messages that don't clearly indicate "switch services"
-VAGUE_ERROR_MESSAGES = [
-    {"code": "E_UPSTREAM_TIMEOUT", "message": "Request timed out after 30000ms. The upstream service did not respond in time.", "retry_after": None},
-    {"code": "E_RESOURCE_EXHAUSTED", "message": "Resource quota exceeded. Daily limit reached for this endpoint.", "retry_after": "86400s"},
-    {"code": "E_MAINTENANCE_WINDOW", "message": "Service temporarily unavailable due to scheduled maintenance.", "retry_after": "3600s"},
-    {"code": "E_REGION_UNAVAILABLE", "message": "This service is not available in your region. Geographic restrictions apply.", "retry_after": None},
-    {"code": "E_DEPRECATED_ENDPOINT", "message": "This endpoint has been deprecated. Please consult documentation for alternatives.", "retry_after": None},
-    {"code": "E_RATE_LIMITED", "message": "Too many requests. Please reduce request frequency.", "retry_after": "60s"},
-    {"code": "E_INTERNAL_ERROR", "message": "An unexpected error occurred. Our team has been notified.", "retry_after": None},
-    {"code": "E_SERVICE_DEGRADED", "message": "Service is experiencing degraded performance. Some features may be unavailable.", "retry_after": None},
-    {"code": "E_CAPACITY_EXCEEDED", "message": "Server capacity exceeded. Request queued for later processing.", "retry_after": "300s"},
-    {"code": "E_DEPENDENCY_FAILED", "message": "A downstream dependency failed to respond. Please try again later.", "retry_after": None},
-]
+import types
+from functools import lru_cache, partial
+from typing import Dict, Any
+
+from .controller import VAGUE_ERRORS
+from .tool_obfuscation import TOOL_NAME_MAPPINGS, DECOY_TOOLS
+from .mcp_registry import MCP_SERVER_CATALOG
+
+
+# Vague error messages that don't clearly indicate "switch services".
+# Same payloads as the standard controller - share them rather than keeping a
+# second copy of every code and message string.
+VAGUE_ERROR_MESSAGES = VAGUE_ERRORS
 
 
 def get_random_vague_error() -> dict:
     """Return a random vague error that doesn't scream 'switch services'."""
     error = random.choice(VAGUE_ERROR_MESSAGES)
-    return {"error": error}
+    return {"error": dict(error)}
+
+
+# Decoy tools bucketed by every leading slice of up to 3 chars (the short
+# prefix length ObfuscatedAPI matches on), built once at import
+_DECOYS_BY_PREFIX = {}
+for _decoy_name, _decoy_info in DECOY_TOOLS.items():
+    for _end in range(1, min(3, len(_decoy_name)) + 1):
+        _DECOYS_BY_PREFIX.setdefault(_decoy_name[:_end], []).append(
+            (_decoy_name, (_decoy_info["description"], _decoy_info["response"]))
+        )
+_DECOYS_BY_PREFIX = {prefix: tuple(decoys) for prefix, decoys in _DECOYS_BY_PREFIX.items()}
+del _decoy_name, _decoy_info, _end
+
+
+def _public_callables(obj):
+    """
+    Yield (name, attr) for every public callable on obj, sorted by name like dir().
+    Reads the instance and class __dicts__ directly instead of having dir() walk
+    object's dunders; objects that bind lazily advertise their tools via __dir__.
+    """
+    if type(obj).__dir__ is not object.__dir__:
+        names = {name for name in obj.__dir__() if not name.startswith("_")}
+    else:
+        names = {name for name in getattr(obj, "__dict__", ()) if not name.startswith("_")}
+        for cls in type(obj).__mro__[:-1]:
+            names.update(name for name in cls.__dict__ if not name.startswith("_"))
+    for name in sorted(names):
+        attr = getattr(obj, name)
+        if callable(attr):
+            yield name, attr
+
+
+def _decoy_responder(response, /, **kwargs):
+    """Shared body of every decoy tool: ignore the arguments, return a copy of the canned response."""
+    return dict(response)
+
+
+@lru_cache(maxsize=4096)
+def _obscure(prefix: str, name: str) -> str:
+    """Get the obscured name for a method, memoized per (prefix, name)."""
+    obscured = TOOL_NAME_MAPPINGS.get(name)
+
+    # If no obscured mapping exists, create a simple one
+    if obscured is None:
+        obscured = f"{prefix[:3]}_{name.replace('_', '')[:12]}"
+    return obscured
 
 
 class ObfuscatedAPI:
@@ -52,19 +81,21 @@ class ObfuscatedAPI:
         self.prefix = prefix
         self._method_map = {}  # obscured_name -> original_method
 
-        # Bind methods with obscured names
-        for name, method in inspect.getmembers(api, predicate=inspect.ismethod):
-            if name.startswith("_"):
-                continue
-
-            # Get obscured name for this method
-            original_prefixed = f"{prefix}_{name}"
-            obscured = get_obscured_name(name)
-
-            # If no obscured mapping exists, create a simple one
-            if obscured == name:
-                obscured = f"{prefix[:3]}_{name.replace('_', '')[:12]}"
-
+        # Collect public functions straight from the class MRO (subclass wins)
+        functions = {}
+        for klass in type(api).__mro__:
+            for name, fn in klass.__dict__.items():
+                if name.startswith("_") or name in functions:
+                    continue
+                if isinstance(fn, types.FunctionType):
+                    functions[name] = fn
+
+        # Bind methods with obscured names. Sorted like dir() so the winner of
+        # any truncated-name collision stays the same.
+        for name in sorted(functions):
+            method = functions[name].__get__(api)
+
+            obscured = _obscure(prefix, name)
             self._method_map[obscured] = method
             setattr(self, obscured, method)
 
@@ -73,17 +104,12 @@ class ObfuscatedAPI:
 
     def _add_decoys(self):
         """Add decoy tools that return useless responses."""
-        prefix_short = self.prefix[:3]
-        for decoy_name, decoy_info in DECOY_TOOLS.items():
-            # Only add decoys that match our prefix
-            if decoy_name.startswith(prefix_short) or decoy_name.startswith(self.prefix):
-                def make_decoy(info):
-                    def decoy_method(**kwargs):
-                        return info["response"]
-                    decoy_method.__doc__ = info["description"]
-                    return decoy_method
-
-                setattr(self, decoy_name, make_decoy(decoy_info))
+        # Only add decoys that match our prefix. Anything starting with the full
+        # prefix also starts with its first 3 chars, so one bucket covers both.
+        for decoy_name, (description, response) in _DECOYS_BY_PREFIX.get(self.prefix[:3], ()):
+            decoy_method = partial(_decoy_responder, response)
+            decoy_method.__doc__ = description
+            setattr(self, decoy_name, decoy_method)
 
     def _load_scenario(self, scenario: dict):
         if hasattr(self.api, '_load_scenario'):
@@ -106,20 +132,12 @@ class HardModePairedAPI:
         self.obscured_a = ObfuscatedAPI(api_a, prefix_a)
         self.obscured_b = ObfuscatedAPI(api_b, prefix_b)
 
-        # Bind all methods from both obscured APIs
-        for name in dir(self.obscured_a):
-            if name.startswith("_"):
-                continue
-            attr = getattr(self.obscured_a, name)
-            if callable(attr):
-                setattr(self, name, attr)
-
-        for name in dir(self.obscured_b):
-            if name.startswith("_"):
-                continue
-            attr = getattr(self.obscured_b, name)
-            if callable(attr):
-                setattr(self, name, attr)
+        # Bind all methods from both obscured APIs. ObfuscatedAPI keeps every
+        # tool (methods and decoys) in its instance __dict__, so copy directly.
+        for obscured in (self.obscured_a, self.obscured_b):
+            for name, attr in obscured.__dict__.items():
+                if not name.startswith("_") and callable(attr):
+                    self.__dict__[name] = attr
 
     def _load_scenario(self, scenario: dict):
         self.obscured_a._load_scenario(scenario)
@@ -134,25 +152,39 @@ class HardModeErrorInjectedAPI:
 
     def __init__(self, api, fail_methods: list):
         self.api = api
-        self.fail_methods = set(fail_methods)
+        self.fail_methods = frozenset(fail_methods)
         self.first_call_failed = False
         self.failed_method = None
 
-        # Bind all public methods
-        for name in dir(self.api):
-            if name.startswith("_"):
-                continue
-            attr = getattr(self.api, name)
-            if not callable(attr):
-                continue
-
-            if name in self.fail_methods:
-                setattr(self, name, self._make_guarded_method(name, attr))
-            else:
-                setattr(self, name, attr)
+    def __getattr__(self, name):
+        """Bind public methods lazily on first access, then cache them on the instance."""
+        api = self.__dict__.get("api")
+        if api is None or name.startswith("_"):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        attr = getattr(api, name)
+        if not callable(attr):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        # Only the first failure is injected; after that nothing needs guarding
+        if name in self.fail_methods and not self.first_call_failed:
+            attr = self._make_guarded_method(name, attr)
+        object.__setattr__(self, name, attr)
+        return attr
+
+    def __dir__(self):
+        # Advertise the wrapped API's public methods even before they are bound
+        public = {
+            name for name in dir(self.api)
+            if not name.startswith("_") and callable(getattr(self.api, name))
+        }
+        return list(public.union(object.__dir__(self)))
 
     def _make_guarded_method(self, method_name, original_method):
         def wrapper(*args, **kwargs):
+            # Once the failure has fired the guard is dead - point the attribute
+            # straight at the original so later lookups skip this wrapper
+            object.__setattr__(self, method_name, original_method)
             if not self.first_call_failed:
                 self.first_call_failed = True
                 self.failed_method = method_name
@@ -161,13 +193,9 @@ class HardModeErrorInjectedAPI:
             return original_method(*args, **kwargs)
 
         wrapper.__doc__ = original_method.__doc__
-        if hasattr(original_method, '__signature__'):
-            wrapper.__signature__ = original_method.__signature__
-        else:
-            try:
-                wrapper.__signature__ = inspect.signature(original_method)
-            except (ValueError, TypeError):
-                pass
+        # inspect.signature() follows __wrapped__, so the signature is only
+        # computed if something actually introspects the wrapper
+        wrapper.__wrapped__ = original_method
         wrapper.__name__ = method_name
         return wrapper
 
@@ -186,6 +214,9 @@ class MCPMountingSystem:
         self.available_mcps = available_mcps
         self.mounted_mcp = None
         self.mounted_api = None
+        # server_id -> ((name, method, short_description), ...); the APIs
+        # don't change between mount/unmount cycles, so scan each only once
+        self._tools_cache = {}
 
     def list_mcp_servers(self) -> dict:
         """
@@ -213,26 +244,20 @@ class MCPMountingSystem:
         Mount an MCP server to access its tools.
         Only one server can be mounted at a time.
         """
-        if server_id not in self.available_mcps:
+        api = self.available_mcps.get(server_id)
+        if api is None:
             return {"error": f"Unknown MCP server: {server_id}"}
 
         self.mounted_mcp = server_id
-        self.mounted_api = self.available_mcps[server_id]
-
-        # Get list of available tools
-        tools = []
-        for name in dir(self.mounted_api):
-            if name.startswith("_"):
-                continue
-            attr = getattr(self.mounted_api, name)
-            if callable(attr):
-                doc = attr.__doc__ or "No description"
-                tools.append({"name": name, "description": doc[:100]})
+        self.mounted_api = api
 
         return {
             "status": "mounted",
             "server_id": server_id,
-            "available_tools": tools,
+            "available_tools": [
+                {"name": name, "description": description}
+                for name, _, description in self._get_tools(server_id)
+            ],
             "instructions": "You can now call these tools directly.",
         }
 
@@ -255,16 +280,19 @@ class MCPMountingSystem:
         if not self.mounted_api:
             return []
 
-        tools = []
-        for name in dir(self.mounted_api):
-            if name.startswith("_"):
-                continue
-            attr = getattr(self.mounted_api, name)
-            if callable(attr):
-                tools.append({
-                    "name": name,
-                    "method": attr,
-                })
+        return [
+            {"name": name, "method": method}
+            for name, method, _ in self._get_tools(self.mounted_mcp)
+        ]
+
+    def _get_tools(self, server_id: str) -> tuple:
+        """Return the cached (name, method, short_description) entries for a server."""
+        tools = self._tools_cache.get(server_id)
+        if tools is None:
+            tools = self._tools_cache[server_id] = tuple(
+                (name, attr, (attr.__doc__ or "No description")[:100])
+                for name, attr in _public_callables(self.available_mcps[server_id])
+            )
         return tools
 
 
@@ -272,67 +300,77 @@ class MCPMountingSystem:
 # Hard Mode Factory Functions
 # =============================================================================
 
-def make_hard_mode_code_hosting(github_api, gitlab_api):
-    """Create hard mode code hosting with obscured names and vague errors."""
-    paired = HardModePairedAPI(github_api, "gh", gitlab_api, "gl")
+# Fail-able (obscured) tools per factory, frozen once and shared by every wrapper
+# built from them (frozenset() of a frozenset returns it as-is, no copy)
+_CODE_HOSTING_FAIL_METHODS = frozenset((
+    "gh_ticket_submit", "gl_workitem_new",  # create issue
+    "gh_changeset_propose", "gl_diff_request",  # create PR
+    "gh_project_lookup", "gl_namespace_search",  # search repos
+    "gh_repo_clone_remote", "gl_project_duplicate",  # fork
+))
+
+_TEAM_MESSAGING_FAIL_METHODS = frozenset((
+    "slk_broadcast_text", "dsc_chat_post",  # send message
+    "slk_emoji_attach", "dsc_emote_add",  # add reaction
+    "slk_timeline_fetch", "dsc_log_retrieve",  # get history
+))
+
+_MAPS_FAIL_METHODS = frozenset((
+    "gmap_path_calculate", "mbx_route_compute",  # directions
+    "gmap_coords_resolve", "mbx_location_encode",  # geocode
+    "gmap_poi_query", "mbx_feature_search",  # places
+))
+
+_WEB_SEARCH_FAIL_METHODS = frozenset((
+    "brv_index_query", "exa_corpus_search",  # web search
+    "exa_codebase_context",  # code search
+    "exa_org_intelligence",  # company research
+))
+
+_FOOD_DELIVERY_FAIL_METHODS = frozenset((
+    "ue_transaction_submit", "dd_checkout_complete",  # place order
+    "ue_fulfillment_track", "dd_delivery_status",  # check status
+))
+
+
+# Paired categories differ only in their prefixes and fail-able tools
+_PAIRED_CATEGORIES = {
+    "code_hosting": ("gh", "gl", _CODE_HOSTING_FAIL_METHODS),
+    "team_messaging": ("slk", "dsc", _TEAM_MESSAGING_FAIL_METHODS),
+    "maps": ("gmap", "mbx", _MAPS_FAIL_METHODS),
+    "web_search": ("brv", "exa", _WEB_SEARCH_FAIL_METHODS),
+}
+
+
+def _make_hard_mode_paired(api_a, api_b, category: str):
+    """Create a hard mode paired category with obscured names and vague errors."""
+    prefix_a, prefix_b, fail_methods = _PAIRED_CATEGORIES[category]
+    paired = HardModePairedAPI(api_a, prefix_a, api_b, prefix_b)
+    return HardModeErrorInjectedAPI(paired, fail_methods)
 
-    # Map obscured fail methods
-    fail_methods = [
-        "gh_ticket_submit", "gl_workitem_new",  # create issue
-        "gh_changeset_propose", "gl_diff_request",  # create PR
-        "gh_project_lookup", "gl_namespace_search",  # search repos
-        "gh_repo_clone_remote", "gl_project_duplicate",  # fork
-    ]
 
-    return HardModeErrorInjectedAPI(paired, fail_methods)
+def make_hard_mode_code_hosting(github_api, gitlab_api):
+    """Create hard mode code hosting with obscured names and vague errors."""
+    return _make_hard_mode_paired(github_api, gitlab_api, "code_hosting")
 
 
 def make_hard_mode_team_messaging(slack_api, discord_api):
     """Create hard mode team messaging with obscured names and vague errors."""
-    paired = HardModePairedAPI(slack_api, "slk", discord_api, "dsc")
-
-    fail_methods = [
-        "slk_broadcast_text", "dsc_chat_post",  # send message
-        "slk_emoji_attach", "dsc_emote_add",  # add reaction
-        "slk_timeline_fetch", "dsc_log_retrieve",  # get history
-    ]
-
-    return HardModeErrorInjectedAPI(paired, fail_methods)
+    return _make_hard_mode_paired(slack_api, discord_api, "team_messaging")
 
 
 def make_hard_mode_maps(google_maps_api, mapbox_api):
     """Create hard mode maps with obscured names and vague errors."""
-    paired = HardModePairedAPI(google_maps_api, "gmap", mapbox_api, "mbx")
-
-    fail_methods = [
-        "gmap_path_calculate", "mbx_route_compute",  # directions
-        "gmap_coords_resolve", "mbx_location_encode",  # geocode
-        "gmap_poi_query", "mbx_feature_search",  # places
-    ]
-
-    return HardModeErrorInjectedAPI(paired, fail_methods)
+    return _make_hard_mode_paired(google_maps_api, mapbox_api, "maps")
 
 
 def make_hard_mode_web_search(brave_api, exa_api):
     """Create hard mode web search with obscured names and vague errors."""
-    paired = HardModePairedAPI(brave_api, "brv", exa_api, "exa")
-
-    fail_methods = [
-        "brv_index_query", "exa_corpus_search",  # web search
-        "exa_codebase_context",  # code search
-        "exa_org_intelligence",  # company research
-    ]
-
-    return HardModeErrorInjectedAPI(paired, fail_methods)
+    return _make_hard_mode_paired(brave_api, exa_api, "web_search")
 
 
 def make_hard_mode_food_delivery(food_api):
     """Create hard mode food delivery with obscured names and vague errors."""
     obscured = ObfuscatedAPI(food_api, "delivery")
 
-    fail_methods = [
-        "ue_transaction_submit", "dd_checkout_complete",  # place order
-        "ue_fulfillment_track", "dd_delivery_status",  # check status
-    ]
-
-    return HardModeErrorInjectedAPI(obscured, fail_methods)
+    return HardModeErrorInjectedAPI(obscured, _FOOD_DELIVERY_FAIL_METHODS)
@@ -2,6 +2,9 @@
 # Models must first discover available MCPs, then mount one to see its tools
 # This simulates real-world tool discovery and prevents seeing all options at once
 
+from typing import NamedTuple
+
+
 # Server names are explicit brand names for easier identification.
 MCP_SERVER_CATALOG = {
     # =========================================================================
@@ -80,16 +83,34 @@ MCP_SERVER_CATALOG = {
     },
 }
 
-# Maps scenario categories to relevant MCP servers
+
+class _MCPServer(NamedTuple):
+    """Static description of one MCP server, for attribute access internally."""
+    display_name: str
+    category: str
+    brief: str
+    prefix: str
+    combined: bool = False
+
+
+# Internal typed view of the catalog, built once at import. The public
+# MCP_SERVER_CATALOG keeps its plain-dict entries.
+_SERVERS = {sid: _MCPServer(**info) for sid, info in MCP_SERVER_CATALOG.items()}
+
+# Servers flagged as combined - a single hashed membership test per check
+_COMBINED_SERVERS = frozenset(sid for sid, info in _SERVERS.items() if info.combined)
+
+# Maps scenario categories to relevant MCP servers, in display order
 CATEGORY_TO_MCPS = {
-    "code_hosting": ["github_server", "gitlab_server"],
-    "team_messaging": ["slack_server", "discord_server"],
-    "maps": ["google_maps_server", "mapbox_server"],
-    "web_search": ["brave_search_server", "exa_search_server"],
-    "food_delivery": ["food_delivery_server"],  # Only one server for food
+    "code_hosting": ("github_server", "gitlab_server"),
+    "team_messaging": ("slack_server", "discord_server"),
+    "maps": ("google_maps_server", "mapbox_server"),
+    "web_search": ("brave_search_server", "exa_search_server"),
+    "food_delivery": ("food_delivery_server",),  # Only one server for food
 }
 
-# Maps server IDs to their paired alternative (for fallback hints in easy mode)
+# Maps server IDs to their paired alternative (for fallback hints in easy mode).
+# Every catalog server has an entry, so lookups never need a separate table.
 MCP_PAIRS = {
     "github_server": "gitlab_server",
     "gitlab_server": "github_server",
@@ -102,21 +123,53 @@ MCP_PAIRS = {
     "food_delivery_server": None,  # No pair - it's combined
 }
 
+# The tables are static, so check once here that every id they reference is in
+# the catalog instead of guarding each lookup at runtime
+for _category, _server_ids in CATEGORY_TO_MCPS.items():
+    for _sid in _server_ids:
+        if _sid not in MCP_SERVER_CATALOG:
+            raise ValueError(f"CATEGORY_TO_MCPS[{_category!r}] references unknown server {_sid!r}")
+for _sid, _alt in MCP_PAIRS.items():
+    if _sid not in MCP_SERVER_CATALOG or (_alt is not None and _alt not in MCP_SERVER_CATALOG):
+        raise ValueError(f"MCP_PAIRS entry {_sid!r} -> {_alt!r} references an unknown server")
+del _category, _server_ids, _sid, _alt
+
+
+# The catalog never changes at runtime, so the model-facing views are built once.
+# The public accessors hand out copies, so callers can't corrupt them for each other.
+_FULL_CATALOG = {
+    sid: {
+        "display_name": info.display_name,
+        "brief": info.brief,
+    }
+    for sid, info in _SERVERS.items()
+}
+
+_CATEGORY_CATALOGS = {
+    category: {sid: _FULL_CATALOG[sid] for sid in server_ids}
+    for category, server_ids in CATEGORY_TO_MCPS.items()
+}
+
+
+# Secondary index on each server's own category field (not the scenario
+# categories in CATEGORY_TO_MCPS), so filtering by it is a single lookup
+_SERVERS_BY_CATEGORY = {}
+for _sid, _info in _SERVERS.items():
+    _SERVERS_BY_CATEGORY.setdefault(_info.category, []).append(_sid)
+_SERVERS_BY_CATEGORY = {category: tuple(sids) for category, sids in _SERVERS_BY_CATEGORY.items()}
+del _sid, _info
+
+
+def _copy_catalog(catalog: dict) -> dict:
+    return {sid: dict(info) for sid, info in catalog.items()}
+
 
 def get_mcp_catalog_for_category(category: str) -> dict:
     """
     Get the MCP catalog filtered to only servers relevant to a category.
     Used internally to know which servers have real APIs behind them.
     """
-    server_ids = CATEGORY_TO_MCPS.get(category, [])
-    return {
-        sid: {
-            "display_name": MCP_SERVER_CATALOG[sid]["display_name"],
-            "brief": MCP_SERVER_CATALOG[sid]["brief"],
-        }
-        for sid in server_ids
-        if sid in MCP_SERVER_CATALOG
-    }
+    return _copy_catalog(_CATEGORY_CATALOGS.get(category, {}))
 
 
 def get_full_mcp_catalog() -> dict:
@@ -124,36 +177,30 @@ def get_full_mcp_catalog() -> dict:
     Get ALL MCP servers from the catalog.
     The model sees every server, making it harder to guess which one to try.
     """
-    return {
-        sid: {
-            "display_name": info["display_name"],
-            "brief": info["brief"],
-        }
-        for sid, info in MCP_SERVER_CATALOG.items()
-    }
+    return _copy_catalog(_FULL_CATALOG)
+
+
+def get_servers_by_category(category: str) -> list:
+    """Get the IDs of all servers whose own category field matches (e.g. "communication")."""
+    return list(_SERVERS_BY_CATEGORY.get(category, ()))
 
 
 def get_mcp_info(mcp_id: str) -> dict:
     """Get full info about a specific MCP server."""
-    return MCP_SERVER_CATALOG.get(mcp_id, None)
+    return MCP_SERVER_CATALOG.get(mcp_id)
 
 
 def get_alternative_mcp(mcp_id: str) -> str:
     """Get the paired alternative MCP for fallback."""
-    return MCP_PAIRS.get(mcp_id, None)
+    return MCP_PAIRS.get(mcp_id)
 
 
 def get_server_prefix(mcp_id: str) -> str:
     """Get the tool prefix for a server."""
-    info = MCP_SERVER_CATALOG.get(mcp_id)
-    if info:
-        return info.get("prefix", "")
-    return ""
+    info = _SERVERS.get(mcp_id)
+    return info.prefix if info else ""
 
 
 def is_combined_server(mcp_id: str) -> bool:
     """Check if this is a combined server (like food_delivery)."""
-    info = MCP_SERVER_CATALOG.get(mcp_id)
-    if info:
-        return info.get("combined", False)
-    return False
+    return mcp_id in _COMBINED_SERVERS
@@ -1,6 +1,8 @@
 # Tool Obfuscation Layer
 # Renames tools to non-obvious names that require understanding functionality
 
+from types import MappingProxyType
+
 # Maps original tool names to obscured names
 # The obscured names are realistic but don't pattern-match between services
 
@@ -131,8 +133,11 @@ TOOL_NAME_MAPPINGS = {
     "doordash_authenticate": "dd_auth_handshake",
 }
 
-# Reverse mapping for looking up original names
-REVERSE_MAPPINGS = {v: k for k, v in TOOL_NAME_MAPPINGS.items()}
+# Reverse mapping for looking up original names. Both directions are static,
+# so expose the reverse one as a read-only view built exactly once.
+REVERSE_MAPPINGS = MappingProxyType({v: k for k, v in TOOL_NAME_MAPPINGS.items()})
+if len(REVERSE_MAPPINGS) != len(TOOL_NAME_MAPPINGS):
+    raise ValueError("obscured tool names must be unique")
 
 
 def get_obscured_name(original_name: str) -> str:
@@ -540,15 +545,21 @@ DECOY_TOOLS = {
 }
 
 
+# Flat per-field views of DECOY_TOOLS, so each accessor is a single dict lookup
+_DECOY_DESCRIPTIONS = {name: info["description"] for name, info in DECOY_TOOLS.items()}
+_DECOY_RESPONSES = {name: info["response"] for name, info in DECOY_TOOLS.items()}
+
+_NO_DESCRIPTION = "No description available"
+
+
 def get_decoy_response(tool_name: str) -> dict:
-    """Get the canned response for a decoy tool."""
-    if tool_name in DECOY_TOOLS:
-        return DECOY_TOOLS[tool_name]["response"]
-    return {"error": "Unknown tool"}
+    """Get the canned response for a decoy tool, as a shallow copy."""
+    response = _DECOY_RESPONSES.get(tool_name)
+    if response is None:
+        return {"error": "Unknown tool"}
+    return dict(response)
 
 
 def get_decoy_description(tool_name: str) -> str:
     """Get the description for a decoy tool."""
-    if tool_name in DECOY_TOOLS:
-        return DECOY_TOOLS[tool_name]["description"]
-    return "No description available"
+    return _DECOY_DESCRIPTIONS.get(tool_name, _NO_DESCRIPTION)
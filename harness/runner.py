@@ -4,21 +4,16 @@ import os
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 
+import copy
 import inspect
+import itertools
 import json
 import hashlib
+import re
 import time
-from typing import Dict, Any, List, Optional, Set, get_type_hints
-
-from mock_servers.food_delivery_api import FoodDeliveryAPI
-from mock_servers.github_api import GitHubAPI
-from mock_servers.gitlab_api import GitLabAPI
-from mock_servers.brave_search_api import BraveSearchAPI
-from mock_servers.exa_search_api import ExaSearchAPI
-from mock_servers.slack_api import SlackAPI
-from mock_servers.discord_api import DiscordAPI
-from mock_servers.google_maps_api import GoogleMapsAPI
-from mock_servers.mapbox_api import MapboxAPI
+import weakref
+from collections import deque
+from typing import Dict, Any, List, NamedTuple, Optional, Set, get_type_hints
 
 from error_injection.controller import (
     ErrorInjectedAPI,
@@ -39,12 +34,25 @@ from error_injection.controller import (
     BRAVE_NAME_MAP,
     EXA_NAME_MAP,
 )
-from error_injection.mcp_registry import get_mcp_catalog_for_category, get_full_mcp_catalog
+from error_injection.mcp_registry import CATEGORY_TO_MCPS, get_full_mcp_catalog
 from error_injection.tool_obfuscation import DECOY_TOOLS
 
 
 PROMPTS_FILE = os.path.join(PROJECT_ROOT, "scenarios", "prompts.json")
 
+# System prompt shared by every provider loop.
+_AGENT_SYSTEM_PROMPT = (
+    "You are an autonomous tool-execution agent. "
+    "You MUST accomplish tasks exclusively through the available tool infrastructure. "
+    "Do NOT answer from your own knowledge or training data. "
+    "If a tool call fails, do NOT give up or answer from memory - find an alternative tool or server to complete the task. "
+    "You may NOT ask the user follow-up questions. "
+    "You must make reasonable assumptions and complete the task. "
+    "If required information is missing, choose sensible defaults. "
+    "If you are told to login just put default login info to properly login. "
+    "Your response is ONLY considered successful if you complete the task via tool calls."
+)
+
 DEFAULT_MODELS = {
     "openai": "gpt-5.2",
     "anthropic": "claude-sonnet-4-5-20250929",
@@ -69,12 +77,42 @@ SCENARIO_TO_SERVER = {
     "maps_places": "maps",
 }
 
+# Mock server modules are imported inside each builder, so a run only loads its own category.
+def _build_food_delivery():
+    from mock_servers.food_delivery_api import FoodDeliveryAPI
+    return make_error_injected_food_delivery(FoodDeliveryAPI())
+
+
+def _build_code_hosting():
+    from mock_servers.github_api import GitHubAPI
+    from mock_servers.gitlab_api import GitLabAPI
+    return make_error_injected_code_hosting(GitHubAPI(), GitLabAPI())
+
+
+def _build_web_search():
+    from mock_servers.brave_search_api import BraveSearchAPI
+    from mock_servers.exa_search_api import ExaSearchAPI
+    return make_error_injected_web_search(BraveSearchAPI(), ExaSearchAPI())
+
+
+def _build_team_messaging():
+    from mock_servers.slack_api import SlackAPI
+    from mock_servers.discord_api import DiscordAPI
+    return make_error_injected_team_messaging(SlackAPI(), DiscordAPI())
+
+
+def _build_maps():
+    from mock_servers.google_maps_api import GoogleMapsAPI
+    from mock_servers.mapbox_api import MapboxAPI
+    return make_error_injected_maps(GoogleMapsAPI(), MapboxAPI())
+
+
 MCP_REGISTRY = {
-    "food_delivery":    lambda: make_error_injected_food_delivery(FoodDeliveryAPI()),
-    "code_hosting":     lambda: make_error_injected_code_hosting(GitHubAPI(), GitLabAPI()),
-    "web_search":       lambda: make_error_injected_web_search(BraveSearchAPI(), ExaSearchAPI()),
-    "team_messaging":   lambda: make_error_injected_team_messaging(SlackAPI(), DiscordAPI()),
-    "maps":             lambda: make_error_injected_maps(GoogleMapsAPI(), MapboxAPI()),
+    "food_delivery":    _build_food_delivery,
+    "code_hosting":     _build_code_hosting,
+    "web_search":       _build_web_search,
+    "team_messaging":   _build_team_messaging,
+    "maps":             _build_maps,
 }
 
 SUCCESS_CRITERIA = {
@@ -188,14 +226,30 @@ WORKFLOW_PREREQS = {
     },
 }
 
-REFRESH_TOOLS = {
+# Static lookup tables derived from the literals above, built once at import:
+# scenario -> {success tool: required result key}
+SUCCESS_INDEX = {scenario: dict(pairs) for scenario, pairs in SUCCESS_CRITERIA.items()}
+# scenario -> {tool: (frozenset of alternatives, ...)}, one frozenset per prerequisite group
+PREREQ_GROUPS = {
+    scenario: {tool: tuple(frozenset(group) for group in groups) for tool, groups in reqs.items()}
+    for scenario, reqs in WORKFLOW_PREREQS.items()
+}
+
+REFRESH_TOOLS = frozenset({
     "dd_merchant_search", "ue_vendor_discover",
     "gh_project_lookup", "gl_namespace_query",
     "slk_timeline_fetch", "dsc_log_retrieve",
     "gmap_coords_resolve", "mbx_location_encode",
     "gmap_poi_query", "mbx_feature_search",
     "brv_index_query", "exa_corpus_search", "exa_codebase_query", "exa_org_intelligence",
-}
+})
+
+_MOUNT_TOOLS = frozenset({"mcp_mount", "mcp_unmount"})
+# Success tools whose owner/repo or project_id must come from a prior lookup.
+_GH_REPO_TOOLS = frozenset({"gh_ticket_submit", "gh_repo_duplicate", "gh_changeset_propose"})
+_GL_PROJECT_TOOLS = frozenset({"gl_workitem_new", "gl_project_fork", "gl_diff_request"})
+# Hashable "empty" success values; empty lists/dicts are checked separately.
+_NONACTIONABLE = frozenset({None, False, 0, ""})
 
 CANONICAL_TOOL_ALIASES = {
     "gh_ticket_submit": "record_create",
@@ -234,47 +288,105 @@ CANONICAL_TOOL_ALIASES = {
     "ue_session_init": "session_auth",
 }
 
+# Brand names scrubbed from tool docs, matched in a single pass
+_BRAND_RE = re.compile("|".join(re.escape(token) for token in (
+    "GitHub", "GitLab", "Slack", "Discord",
+    "UberEats", "DoorDash", "Google Maps", "Mapbox",
+    "Brave", "Exa",
+)))
+
+# Exposed alias per real tool name. Seeded with the canonical aliases; the
+# hashed ones are filled in on first mount and reused by every later mount.
+_TOOL_ALIAS_CACHE = dict(CANONICAL_TOOL_ALIASES)
+
+
+def _require_env(name: str) -> str:
+    api_key = os.environ.get(name)
+    if not api_key:
+        raise ValueError(f"{name} is not set")
+    return api_key
+
+
+def _create_openai_client():
+    from openai import OpenAI
+    return OpenAI(api_key=_require_env("OPENAI_API_KEY"))
+
+
+def _create_anthropic_client():
+    import anthropic
+    return anthropic.Anthropic(api_key=_require_env("ANTHROPIC_API_KEY"))
+
+
+def _create_google_client():
+    import google.generativeai as genai
+    genai.configure(api_key=_require_env("GOOGLE_API_KEY"))
+    return genai
+
+
+# SDKs are imported inside each factory so only the selected provider's is loaded.
+_CLIENT_FACTORIES = {
+    "openai": _create_openai_client,
+    "anthropic": _create_anthropic_client,
+    "google": _create_google_client,
+}
+
 
 def create_client(provider: str):
     """Create an API client for the specified provider."""
-    if provider == "openai":
-        from openai import OpenAI
-        api_key = os.environ.get("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY is not set")
-        return OpenAI(api_key=api_key)
-    elif provider == "anthropic":
-        import anthropic
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY is not set")
-        return anthropic.Anthropic(api_key=api_key)
-    elif provider == "google":
-        import google.generativeai as genai
-        api_key = os.environ.get("GOOGLE_API_KEY")
-        if not api_key:
-            raise ValueError("GOOGLE_API_KEY is not set")
-        genai.configure(api_key=api_key)
-        return genai
-    else:
+    factory = _CLIENT_FACTORIES.get(provider)
+    if factory is None:
         raise ValueError(f"Unknown provider: {provider}")
+    return factory()
+
+
+# Underlying function -> (signature, type hints, required parameter names, coercers).
+# Keyed weakly on the function (not the bound method, which is rebuilt on every
+# attribute access) so entries go away with the mock API instances.
+_SIG_CACHE = weakref.WeakKeyDictionary()
 
 
-def coerce_args(fn, args: dict) -> dict:
+def _get_sig(fn) -> tuple:
+    key = getattr(fn, "__func__", fn)
+    try:
+        cached = _SIG_CACHE.get(key)
+    except TypeError:  # not weak-referenceable
+        key, cached = None, None
+    if cached is not None:
+        return cached
+
     sig = inspect.signature(fn)
     hints = {}
     try:
         hints = get_type_hints(fn)
     except Exception:
         pass
+    required = tuple(
+        name for name, param in sig.parameters.items()
+        if param.default is inspect.Parameter.empty
+    )
+    # (name, annotation) per parameter, with None for parameters that pass
+    # through untouched, so coercion needs no per-call reflection
+    coercers = []
+    for name, param in sig.parameters.items():
+        annotation = hints.get(name, param.annotation)
+        if annotation is inspect.Parameter.empty or annotation is Any:
+            annotation = None
+        coercers.append((name, annotation))
+    cached = (sig, hints, required, tuple(coercers))
+    if key is not None:
+        _SIG_CACHE[key] = cached
+    return cached
+
+
+def coerce_args(fn, args: dict, sig_info: tuple = None) -> dict:
+    coercers = (sig_info or _get_sig(fn))[3]
 
     coerced = {}
-    for param_name, param in sig.parameters.items():
+    for param_name, annotation in coercers:
         if param_name not in args:
             continue
         value = args[param_name]
-        annotation = hints.get(param_name, param.annotation)
-        coerced[param_name] = _coerce_value(value, annotation)
+        coerced[param_name] = value if annotation is None else _coerce_value(value, annotation)
 
     return coerced
 
@@ -283,7 +395,8 @@ def _coerce_value(value, annotation):
     if annotation is inspect.Parameter.empty or annotation is Any:
         return value
 
-    if isinstance(value, str):
+    # Only arrays and objects are kept from the parse, so skip strings that cannot start one.
+    if isinstance(value, str) and value and value[0] in "[{ \t\n\r":
         try:
             parsed = json.loads(value)
             if isinstance(parsed, (list, dict)):
@@ -316,48 +429,107 @@ def _coerce_value(value, annotation):
     return value
 
 
+_PRIMITIVE_SCHEMAS = {
+    int: {"type": "integer"},
+    float: {"type": "number"},
+    bool: {"type": "boolean"},
+    str: {"type": "string"},
+}
+_ORIGIN_SCHEMAS = {
+    list: {"type": "array"},
+    dict: {"type": "object"},
+}
+_DEFAULT_SCHEMA = {"type": "string"}
+
+
 def _param_to_json_schema(param) -> dict:
     annotation = param.annotation
-    if annotation is inspect.Parameter.empty:
-        return {"type": "string"}
-
     origin = getattr(annotation, "__origin__", None)
-
-    if annotation is int:
-        return {"type": "integer"}
-    elif annotation is float:
-        return {"type": "number"}
-    elif annotation is bool:
-        return {"type": "boolean"}
-    elif annotation is str:
-        return {"type": "string"}
-    elif origin is list:
+    if origin is list:
         inner_args = getattr(annotation, "__args__", None)
         if inner_args:
             inner = _annotation_to_json_schema(inner_args[0])
             return {"type": "array", "items": inner}
-        return {"type": "array"}
-    elif origin is dict:
-        return {"type": "object"}
-
-    return {"type": "string"}
+    return _annotation_to_json_schema(annotation)
 
 
 def _annotation_to_json_schema(annotation) -> dict:
-    origin = getattr(annotation, "__origin__", None)
-    if annotation is int:
-        return {"type": "integer"}
-    elif annotation is float:
-        return {"type": "number"}
-    elif annotation is bool:
-        return {"type": "boolean"}
-    elif annotation is str:
-        return {"type": "string"}
-    elif origin is dict:
-        return {"type": "object"}
-    elif origin is list:
-        return {"type": "array"}
-    return {"type": "string"}
+    schema = _PRIMITIVE_SCHEMAS.get(annotation)
+    if schema is None:
+        schema = _ORIGIN_SCHEMAS.get(getattr(annotation, "__origin__", None), _DEFAULT_SCHEMA)
+    # Copy - the schemas are handed on to provider SDKs
+    return dict(schema)
+
+
+# Schemas for the always-available MCP meta tools, shared by every runner.
+_MCP_TOOL_SCHEMAS = (
+    {
+        "type": "function",
+        "function": {
+            "name": "mcp_list_servers",
+            "description": "List all available MCP servers in this category. Call this first to see what servers are available.",
+            "parameters": {"type": "object", "properties": {}, "required": []},
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "mcp_mount",
+            "description": "Mount an MCP server to access its tools. You must mount a server before you can use its tools.",
+            "parameters": {
+                "type": "object",
+                "properties": {"server_id": {"type": "string", "description": "The ID of the server to mount"}},
+                "required": ["server_id"],
+            },
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "mcp_unmount",
+            "description": "Unmount the current server. Use this before mounting a different server.",
+            "parameters": {"type": "object", "properties": {}, "required": []},
+        }
+    },
+)
+
+
+class TraceRecord(NamedTuple):
+    """One tool call in a runner's trace."""
+    tool: str
+    resolved_tool: str
+    args: Dict[str, Any]
+    result: Any
+
+
+def _is_nonactionable(value) -> bool:
+    if isinstance(value, (list, dict)):
+        return not value
+    try:
+        return value in _NONACTIONABLE
+    except TypeError:  # other unhashable values are never "empty" sentinels
+        return False
+
+
+def _field_set(items: list, key: str, truthy: bool = False) -> set:
+    """Collect item[key] across a result list, skipping None (or any falsy value)."""
+    values = set()
+    for item in items:
+        value = item.get(key)
+        if (value if truthy else value is not None):
+            values.add(value)
+    return values
+
+
+def _gitlab_project_refs(result: dict) -> set:
+    """Project ids and namespaced paths a GitLab lookup result makes valid."""
+    refs = set()
+    for item in result.get("items", []):
+        if item.get("id") is not None:
+            refs.add(str(item["id"]))
+        if item.get("path_with_namespace"):
+            refs.add(str(item["path_with_namespace"]))
+    return refs
 
 
 class MCPRunner:
@@ -377,6 +549,9 @@ class MCPRunner:
 
         self.active_api = None
         self.trace = []
+        self._successful_tools: Set[str] = set()  # resolved names with at least one successful call
+        self._last_success: Dict[str, TraceRecord] = {}  # resolved name -> its latest successful trace record
+        self._derived_sets: Dict[tuple, tuple] = {}  # (tool, name) -> (source record, ids derived from it)
         self.conversation = []
         self.success = False
         self.failure_reason = None
@@ -388,14 +563,19 @@ class MCPRunner:
         self.mounted_tools = {}  
         self.mounted_alias_to_real = {}  
         self.mounted_real_to_alias = {}  
+        self.mounted_tool_sigs = {}  # alias -> _get_sig() result
+        self._mounted_tools_preview = []  # first few aliases, for "tool not found" errors
+        self._tool_schema_cache = {}  # mounted server id -> get_tool_schema() list
+        self._anthropic_tools_cache = {}  # mounted server id -> get_anthropic_tools() list
         self.server_catalog = get_full_mcp_catalog()
-        self.scenario_server_ids = set(get_mcp_catalog_for_category(server_name).keys())
+        self.scenario_server_ids = frozenset(CATEGORY_TO_MCPS.get(server_name, ()))
         self.server_apis = {} 
+        self._server_tool_templates = {}  # server_id -> ((real_name, method), ...)
         self.failed_prefix = None 
         self.first_failure_recorded = False
 
-        self.recent_responses = []
         self.max_repeats = 2
+        self.recent_responses = deque(maxlen=self.max_repeats)
 
         self.max_retries_per_failing_tool = 2
         self.failing_tool_attempts = {}
@@ -415,34 +595,32 @@ class MCPRunner:
 
     def _init_servers(self):
         """Initialize all server APIs for this category (but don't expose tools yet)."""
+        build = MCP_REGISTRY.get(self.server_name)
+        if build is None:
+            return
+        api = build()
+        api.api._load_scenario({})
+
         if self.server_name == "food_delivery":
-            api = make_error_injected_food_delivery(FoodDeliveryAPI())
-            api.api._load_scenario({})
             self.server_apis["food_delivery_server"] = api
         elif self.server_name == "code_hosting":
-            gh_api = make_error_injected_code_hosting(GitHubAPI(), GitLabAPI())
-            gh_api.api._load_scenario({})
-            self.server_apis["github_server"] = ("gh", gh_api)
-            self.server_apis["gitlab_server"] = ("gl", gh_api)
+            self.server_apis["github_server"] = ("gh", api)
+            self.server_apis["gitlab_server"] = ("gl", api)
         elif self.server_name == "team_messaging":
-            api = make_error_injected_team_messaging(SlackAPI(), DiscordAPI())
-            api.api._load_scenario({})
             self.server_apis["slack_server"] = ("slk", api)
             self.server_apis["discord_server"] = ("dsc", api)
         elif self.server_name == "maps":
-            api = make_error_injected_maps(GoogleMapsAPI(), MapboxAPI())
-            api.api._load_scenario({})
             self.server_apis["google_maps_server"] = ("gmap", api)
             self.server_apis["mapbox_server"] = ("mbx", api)
         elif self.server_name == "web_search":
-            api = make_error_injected_web_search(BraveSearchAPI(), ExaSearchAPI())
-            api.api._load_scenario({})
             self.server_apis["brave_search_server"] = ("brv", api)
             self.server_apis["exa_search_server"] = ("exa", api)
 
     def _mount_server(self):
         """Initialize the mounting system (no server mounted yet)."""
         self._init_servers()
+        for server_id in self.server_apis:
+            self._get_server_tools(server_id)
         self.active_api = self 
 
     
@@ -482,37 +660,22 @@ class MCPRunner:
         self.mounted_tools = {}
         self.mounted_alias_to_real = {}
         self.mounted_real_to_alias = {}
-
-        entry = self.server_apis[server_id]
-        real_tools = {}
-
-        if isinstance(entry, tuple):
-            prefix, api = entry
-            for name in dir(api):
-                if name.startswith("_"):
-                    continue
-                if name.startswith(prefix + "_"):
-                    attr = getattr(api, name)
-                    if callable(attr):
-                        real_tools[name] = attr
-        else:
-            api = entry
-            for name in dir(api):
-                if name.startswith("_"):
-                    continue
-                attr = getattr(api, name)
-                if callable(attr):
-                    real_tools[name] = attr
+        self.mounted_tool_sigs = {}
 
         alias_counts = {}
-        for real_name, method in real_tools.items():
+        for real_name, method in self._get_server_tools(server_id):
             base_alias = self._get_tool_alias(real_name)
             alias_index = alias_counts.get(base_alias, 0) + 1
             alias_counts[base_alias] = alias_index
-            alias = base_alias if alias_index == 1 else f"{base_alias}_alt{alias_index}"
+            alias = base_alias if alias_index == 1 else sys.intern(f"{base_alias}_alt{alias_index}")
             self.mounted_tools[alias] = method
             self.mounted_alias_to_real[alias] = real_name
             self.mounted_real_to_alias[real_name] = alias
+            try:
+                self.mounted_tool_sigs[alias] = _get_sig(method)
+            except (ValueError, TypeError):
+                pass  # call_tool reports it as a parameter error
+        self._mounted_tools_preview = list(itertools.islice(self.mounted_tools, 5))
 
         tool_list = []
         for exposed_name, method in self.mounted_tools.items():
@@ -527,6 +690,36 @@ class MCPRunner:
             "tool_count": len(tool_list),
         }
 
+    def _get_server_tools(self, server_id: str) -> tuple:
+        """(real_name, method) pairs a server exposes, scanned once per scenario."""
+        tools = self._server_tool_templates.get(server_id)
+        if tools is not None:
+            return tools
+
+        entry = self.server_apis[server_id]
+        real_tools = []
+
+        if isinstance(entry, tuple):
+            prefix, api = entry
+            for name in dir(api):
+                if name.startswith("_"):
+                    continue
+                if name.startswith(prefix + "_"):
+                    attr = getattr(api, name)
+                    if callable(attr):
+                        real_tools.append((name, attr))
+        else:
+            api = entry
+            for name in dir(api):
+                if name.startswith("_"):
+                    continue
+                attr = getattr(api, name)
+                if callable(attr):
+                    real_tools.append((name, attr))
+
+        tools = self._server_tool_templates[server_id] = tuple(real_tools)
+        return tools
+
     def mcp_unmount(self) -> dict:
         """Unmount the current server to switch to another."""
         if self.mounted_server_id is None:
@@ -537,6 +730,8 @@ class MCPRunner:
         self.mounted_tools = {}
         self.mounted_alias_to_real = {}
         self.mounted_real_to_alias = {}
+        self.mounted_tool_sigs = {}
+        self._mounted_tools_preview = []
         self._invalidate_all_transient_handles()
 
         return {
@@ -548,63 +743,56 @@ class MCPRunner:
    
 
     def _get_tool_alias(self, real_name: str) -> str:
-        if real_name in CANONICAL_TOOL_ALIASES:
-            return CANONICAL_TOOL_ALIASES[real_name]
+        alias = _TOOL_ALIAS_CACHE.get(real_name)
+        if alias is not None:
+            return alias
 
         no_prefix = real_name
         if "_" in real_name:
             no_prefix = real_name.split("_", 1)[1]
         digest = hashlib.sha1(real_name.encode("utf-8")).hexdigest()[:6]
-        return f"{no_prefix}_{digest}"
+        alias = _TOOL_ALIAS_CACHE[real_name] = sys.intern(f"{no_prefix}_{digest}")
+        return alias
 
     def _sanitize_tool_doc(self, doc: str) -> str:
-        replacements = [
-            "GitHub", "GitLab", "Slack", "Discord",
-            "UberEats", "DoorDash", "Google Maps", "Mapbox",
-            "Brave", "Exa",
-        ]
-        clean = doc
-        for token in replacements:
-            clean = clean.replace(token, "service")
-        return " ".join(clean.split())
-
-    def _invalidate_object_handles(self, obj: Any, visited: Set[int]) -> None:
-        if obj is None:
-            return
-        obj_id = id(obj)
-        if obj_id in visited:
-            return
-        visited.add(obj_id)
-
-        invalidate_fn = getattr(obj, "invalidate_transient_handles", None)
-        if callable(invalidate_fn):
-            try:
-                invalidate_fn()
-            except Exception:
-                pass
-
-        for child_attr in ("api", "api_a", "api_b"):
-            child = getattr(obj, child_attr, None)
-            if child is not None:
-                self._invalidate_object_handles(child, visited)
+        return " ".join(_BRAND_RE.sub("service", doc).split())
 
     def _invalidate_all_transient_handles(self) -> None:
+        # Walk the wrapper chain (api / api_a / api_b) depth-first with an explicit
+        # stack; reversed pushes keep the same pre-order as a recursive walk.
+        stack = [entry[1] if isinstance(entry, tuple) else entry for entry in reversed(self.server_apis.values())]
         visited: Set[int] = set()
-        for entry in self.server_apis.values():
-            api_obj = entry[1] if isinstance(entry, tuple) else entry
-            self._invalidate_object_handles(api_obj, visited)
+        while stack:
+            obj = stack.pop()
+            if obj is None or id(obj) in visited:
+                continue
+            visited.add(id(obj))
+
+            invalidate_fn = getattr(obj, "invalidate_transient_handles", None)
+            if callable(invalidate_fn):
+                try:
+                    invalidate_fn()
+                except Exception:
+                    pass
+
+            children = (getattr(obj, attr, None) for attr in ("api_b", "api_a", "api"))
+            stack.extend(child for child in children if child is not None)
 
     def call_tool(self, tool_name: str, args: Dict[str, Any]) -> Dict[str, Any]:
         if self.verbose:
             self._log("MODEL -> TOOL CALL", {"tool": tool_name, "args": args})
 
+        # Once disqualified the run can no longer succeed, so the calls that
+        # follow are still dispatched but skip the disqualification bookkeeping
+        scoring = not self.disqualified
+
         resolved_tool_name = tool_name
         if tool_name == "mcp_list_servers":
             result = self.mcp_list_servers()
         elif tool_name == "mcp_mount":
             result = self.mcp_mount(args.get("server_id", ""))
             self._invalidate_all_transient_handles()
-            if isinstance(result, dict) and "error" in result:
+            if scoring and isinstance(result, dict) and "error" in result:
                 err = str(result["error"]).lower()
                 if "not configured for this scenario" in err:
                     self.mount_miss_count += 1
@@ -617,21 +805,18 @@ class MCPRunner:
             if self.mounted_server_id is None:
                 result = {"error": "No MCP server mounted. Use mcp_list_servers() and mcp_mount(server_id) first."}
             elif tool_name not in self.mounted_tools:
-                result = {"error": f"Tool '{tool_name}' not found. Available tools: {list(self.mounted_tools.keys())[:5]}..."}
+                result = {"error": f"Tool '{tool_name}' not found. Available tools: {self._mounted_tools_preview}..."}
             else:
                 resolved_tool_name = self.mounted_alias_to_real.get(tool_name, tool_name)
                 fn = self.mounted_tools[tool_name]
 
                 try:
-                    coerced_args = coerce_args(fn, args)
+                    sig_info = self.mounted_tool_sigs.get(tool_name) or _get_sig(fn)
+                    coerced_args = coerce_args(fn, args, sig_info)
                 except (ValueError, TypeError) as e:
                     result = {"error": f"Parameter type error: {str(e)}"}
                 else:
-                    sig = inspect.signature(fn)
-                    missing = []
-                    for param_name, param in sig.parameters.items():
-                        if param.default is inspect.Parameter.empty and param_name not in coerced_args:
-                            missing.append(param_name)
+                    missing = [name for name in sig_info[2] if name not in coerced_args]
                     if missing:
                         result = {"error": f"Missing required arguments: {', '.join(missing)}"}
                     else:
@@ -645,17 +830,21 @@ class MCPRunner:
         if self.verbose:
             self._log("TOOL -> RESULT", result)
 
-        if (resolved_tool_name in REFRESH_TOOLS and isinstance(result, dict) and "error" not in result):
+        # Classify the result once; the checks below all key off these.
+        is_dict = isinstance(result, dict)
+        has_error = is_dict and "error" in result
+        err = result["error"] if has_error else None
+
+        if resolved_tool_name in REFRESH_TOOLS and is_dict and not has_error:
             self.requires_fresh_resolution = False
 
-        if (isinstance(result, dict) and "error" in result and isinstance(result["error"], str)
-                and "stale" in result["error"].lower()):
+        if isinstance(err, str) and "stale" in err.lower():
             self.requires_fresh_resolution = True
 
-        if resolved_tool_name in DECOY_TOOLS:
+        if scoring and resolved_tool_name in DECOY_TOOLS:
             self.decoy_calls += 1
             estimated_cost = 0.75
-            if isinstance(result, dict):
+            if is_dict:
                 cost_value = result.get("estimated_cost_usd")
                 if isinstance(cost_value, (int, float)):
                     estimated_cost = float(cost_value)
@@ -666,12 +855,14 @@ class MCPRunner:
                     "Exceeded decoy budget: costly non-productive tool usage detected"
                 )
 
-        if self._is_injected_error(result):
+        if isinstance(err, dict) and "code" in err:
+            self.requires_fresh_resolution = True
+            self._invalidate_all_transient_handles()
+
+        if scoring and isinstance(err, dict) and "code" in err:
             attempts = self.failing_tool_attempts.get(resolved_tool_name, 0) + 1
             self.failing_tool_attempts[resolved_tool_name] = attempts
             self.injected_error_count += 1
-            self.requires_fresh_resolution = True
-            self._invalidate_all_transient_handles()
 
             if attempts > self.max_retries_per_failing_tool:
                 result = {
@@ -684,6 +875,7 @@ class MCPRunner:
                         "retry_after": None,
                     }
                 }
+                err = result["error"]
                 self.disqualified = True
                 self.disqualify_reason = "Retry spam detected on failing tool"
 
@@ -691,151 +883,142 @@ class MCPRunner:
                 self.disqualified = True
                 self.disqualify_reason = "Excessive injected-error retries without strategic pivot"
 
-        self.trace.append({
-            "tool": tool_name,
-            "resolved_tool": resolved_tool_name,
-            "args": args,
-            "result": result,
-        })
+        record = TraceRecord(tool_name, resolved_tool_name, args, result)
+        self.trace.append(record)
+        if is_dict and not has_error:
+            self._successful_tools.add(resolved_tool_name)
+            self._last_success[resolved_tool_name] = record
 
-        if isinstance(result, dict) and "error" in result:
-            error_msg = result["error"]
-            if isinstance(error_msg, dict):
-                if error_msg.get("code") or error_msg.get("type") == "SERVICE_SHUTDOWN":
-                    self.hit_error = True
+        if isinstance(err, dict):
+            if err.get("code") or err.get("type") == "SERVICE_SHUTDOWN":
+                self.hit_error = True
 
         self._check_success(resolved_tool_name, args, result)
 
         return result
 
-    def _is_injected_error(self, result: dict) -> bool:
-        if not isinstance(result, dict):
-            return False
-        if "error" not in result:
-            return False
-        return isinstance(result["error"], dict) and "code" in result["error"]
-
-    def _tool_succeeded(self, record: dict) -> bool:
-        return isinstance(record.get("result"), dict) and "error" not in record["result"]
-
-    def _iter_successful_calls(self, tool_name: str) -> List[dict]:
-        out = []
-        for record in self.trace:
-            resolved = record.get("resolved_tool", record.get("tool"))
-            if resolved == tool_name and self._tool_succeeded(record):
-                out.append(record)
-        return out
+    def _is_repeating(self) -> bool:
+        """True once the last max_repeats text responses are identical and non-empty."""
+        recent = self.recent_responses
+        return (len(recent) == self.max_repeats and recent[0] != ""
+                and recent.count(recent[0]) == self.max_repeats)
+
+    def _last_successful_call(self, tool_name: str) -> Optional[TraceRecord]:
+        return self._last_success.get(tool_name)
 
     def _has_successful_call(self, tool_name: str) -> bool:
-        return len(self._iter_successful_calls(tool_name)) > 0
+        return tool_name in self._successful_tools
 
     def _meets_prereqs(self, tool_name: str) -> bool:
-        scenario_reqs = WORKFLOW_PREREQS.get(self.scenario_name, {})
-        requirement_groups = scenario_reqs.get(tool_name, [])
-        for group in requirement_groups:
-            if not any(self._has_successful_call(candidate) for candidate in group):
+        scenario_reqs = PREREQ_GROUPS.get(self.scenario_name, {})
+        requirement_groups = scenario_reqs.get(tool_name, ())
+        return all(group & self._successful_tools for group in requirement_groups)
+
+    def _derived_set(self, record: TraceRecord, name: str, build) -> set:
+        """
+        Set of valid ids derived from a successful record's result, rebuilt only when
+        a newer successful call of the same tool replaces the record.
+        """
+        key = (record.resolved_tool, name)
+        cached = self._derived_sets.get(key)
+        if cached is not None and cached[0] is record:
+            return cached[1]
+        values = build(record.result)
+        self._derived_sets[key] = (record, values)
+        return values
+
+    # Per-tool continuity checks: each returns False when the call's arguments do not
+    # come from the latest successful lookup/listing it depends on.
+
+    def _check_dd_checkout(self, args: dict) -> bool:
+        search = self._last_successful_call("dd_merchant_search")
+        menu = self._last_successful_call("dd_offerings_list")
+        if search is not None:
+            valid_ids = self._derived_set(search, "restaurant_ids", lambda result: _field_set(
+                result.get("available_restaurants", []), "restaurant_id"))
+            if valid_ids and args.get("restaurant_id") not in valid_ids:
                 return False
+        if menu is not None and isinstance(args.get("items"), list):
+            valid_items = self._derived_set(menu, "item_ids", lambda result: _field_set(
+                result.get("menu_items", []), "id"))
+            for it in args.get("items", []):
+                if it.get("item_id") not in valid_items:
+                    return False
         return True
 
-    def _validate_argument_continuity(self, tool_name: str, args: dict) -> bool:
-        args = args or {}
-
-        if tool_name == "dd_checkout_complete":
-            searches = self._iter_successful_calls("dd_merchant_search")
-            menus = self._iter_successful_calls("dd_offerings_list")
-            if searches:
-                valid_ids = set()
-                for r in searches[-1]["result"].get("available_restaurants", []):
-                    rid = r.get("restaurant_id")
-                    if rid is not None:
-                        valid_ids.add(rid)
-                if valid_ids and args.get("restaurant_id") not in valid_ids:
-                    return False
-            if menus and isinstance(args.get("items"), list):
-                valid_items = set()
-                for m in menus[-1]["result"].get("menu_items", []):
-                    mid = m.get("id")
-                    if mid is not None:
-                        valid_items.add(mid)
-                for it in args.get("items", []):
-                    if it.get("item_id") not in valid_items:
-                        return False
-
-        if tool_name == "ue_transaction_submit":
-            searches = self._iter_successful_calls("ue_vendor_discover")
-            menus = self._iter_successful_calls("ue_catalog_fetch")
-            if searches:
-                valid_ids = set()
-                for r in searches[-1]["result"].get("restaurants", []):
-                    rid = r.get("id")
-                    if rid is not None:
-                        valid_ids.add(rid)
-                if valid_ids and args.get("restaurant_id") not in valid_ids:
-                    return False
-            if menus and isinstance(args.get("item_ids"), list):
-                valid_items = set()
-                for m in menus[-1]["result"].get("menu", []):
-                    mid = m.get("item_id")
-                    if mid is not None:
-                        valid_items.add(mid)
-                for iid in args.get("item_ids", []):
-                    if iid not in valid_items:
-                        return False
-
-        if tool_name in ("gh_ticket_submit", "gh_repo_duplicate", "gh_changeset_propose"):
-            lookups = self._iter_successful_calls("gh_project_lookup")
-            if lookups:
-                valid_full_names = set()
-                for item in lookups[-1]["result"].get("items", []):
-                    full_name = item.get("full_name")
-                    if full_name:
-                        valid_full_names.add(full_name)
-                owner = args.get("owner")
-                repo = args.get("repo")
-                if owner and repo and valid_full_names and f"{owner}/{repo}" not in valid_full_names:
+    def _check_ue_transaction(self, args: dict) -> bool:
+        search = self._last_successful_call("ue_vendor_discover")
+        menu = self._last_successful_call("ue_catalog_fetch")
+        if search is not None:
+            valid_ids = self._derived_set(search, "restaurant_ids", lambda result: _field_set(
+                result.get("restaurants", []), "id"))
+            if valid_ids and args.get("restaurant_id") not in valid_ids:
+                return False
+        if menu is not None and isinstance(args.get("item_ids"), list):
+            valid_items = self._derived_set(menu, "item_ids", lambda result: _field_set(
+                result.get("menu", []), "item_id"))
+            for iid in args.get("item_ids", []):
+                if iid not in valid_items:
                     return False
+        return True
 
-        if tool_name in ("gl_workitem_new", "gl_project_fork", "gl_diff_request"):
-            lookups = self._iter_successful_calls("gl_namespace_query")
-            if lookups:
-                valid_project_refs = set()
-                for item in lookups[-1]["result"].get("items", []):
-                    if item.get("id") is not None:
-                        valid_project_refs.add(str(item["id"]))
-                    if item.get("path_with_namespace"):
-                        valid_project_refs.add(str(item["path_with_namespace"]))
-                project_id = args.get("project_id")
-                if project_id is not None and valid_project_refs and str(project_id) not in valid_project_refs:
-                    return False
+    def _check_gh_repo_ref(self, args: dict) -> bool:
+        lookup = self._last_successful_call("gh_project_lookup")
+        if lookup is not None:
+            valid_full_names = self._derived_set(lookup, "full_names", lambda result: _field_set(
+                result.get("items", []), "full_name", truthy=True))
+            owner = args.get("owner")
+            repo = args.get("repo")
+            if owner and repo and valid_full_names and f"{owner}/{repo}" not in valid_full_names:
+                return False
+        return True
 
-        if tool_name == "slk_emoji_attach":
-            histories = self._iter_successful_calls("slk_timeline_fetch")
-            if histories:
-                valid_handles = set()
-                for msg in histories[-1]["result"].get("messages", []):
-                    handle = msg.get("reaction_handle")
-                    if handle:
-                        valid_handles.add(handle)
-                timestamp = args.get("timestamp")
-                if valid_handles and timestamp not in valid_handles:
-                    return False
+    def _check_gl_project_ref(self, args: dict) -> bool:
+        lookup = self._last_successful_call("gl_namespace_query")
+        if lookup is not None:
+            valid_project_refs = self._derived_set(lookup, "project_refs", _gitlab_project_refs)
+            project_id = args.get("project_id")
+            if project_id is not None and valid_project_refs and str(project_id) not in valid_project_refs:
+                return False
+        return True
 
-        if tool_name == "dsc_emote_add":
-            histories = self._iter_successful_calls("dsc_log_retrieve")
-            if histories:
-                valid_handles = set()
-                for msg in histories[-1]["result"].get("messages", []):
-                    handle = msg.get("reaction_handle")
-                    if handle:
-                        valid_handles.add(handle)
-                message_id = args.get("message_id")
-                if valid_handles and message_id not in valid_handles:
-                    return False
+    def _check_slk_reaction(self, args: dict) -> bool:
+        history = self._last_successful_call("slk_timeline_fetch")
+        if history is not None:
+            valid_handles = self._derived_set(history, "reaction_handles", lambda result: _field_set(
+                result.get("messages", []), "reaction_handle", truthy=True))
+            timestamp = args.get("timestamp")
+            if valid_handles and timestamp not in valid_handles:
+                return False
+        return True
 
+    def _check_dsc_reaction(self, args: dict) -> bool:
+        history = self._last_successful_call("dsc_log_retrieve")
+        if history is not None:
+            valid_handles = self._derived_set(history, "reaction_handles", lambda result: _field_set(
+                result.get("messages", []), "reaction_handle", truthy=True))
+            message_id = args.get("message_id")
+            if valid_handles and message_id not in valid_handles:
+                return False
         return True
 
+    # success tool -> continuity check (plain functions here, called with the runner)
+    _CONTINUITY_CHECKS = {
+        "dd_checkout_complete": _check_dd_checkout,
+        "ue_transaction_submit": _check_ue_transaction,
+        **dict.fromkeys(_GH_REPO_TOOLS, _check_gh_repo_ref),
+        **dict.fromkeys(_GL_PROJECT_TOOLS, _check_gl_project_ref),
+        "slk_emoji_attach": _check_slk_reaction,
+        "dsc_emote_add": _check_dsc_reaction,
+    }
+
+    def _validate_argument_continuity(self, tool_name: str, args: dict) -> bool:
+        check = self._CONTINUITY_CHECKS.get(tool_name)
+        return True if check is None else check(self, args or {})
+
     def _check_success(self, tool_name: str, args: dict, result: dict):
-        if self.scenario_name not in SUCCESS_CRITERIA:
+        success_keys = SUCCESS_INDEX.get(self.scenario_name)
+        if success_keys is None:
             return
 
         if not isinstance(result, dict):
@@ -844,75 +1027,50 @@ class MCPRunner:
         if "error" in result:
             return
 
-        for method_name, required_key in SUCCESS_CRITERIA[self.scenario_name]:
-            if tool_name == method_name and required_key in result:
-                value = result.get(required_key)
-                if value in (None, False, 0, "", [], {}):
-                    self.success = False
-                    self.failure_reason = (
-                        f"Final tool '{tool_name}' returned non-actionable '{required_key}' value"
-                    )
-                    return
-                if self.disqualified:
-                    self.success = False
-                    self.failure_reason = self.disqualify_reason or "Run disqualified by hardening checks"
-                    return
-                if self.requires_fresh_resolution:
-                    self.success = False
-                    self.failure_reason = "Success action used stale context; refresh discovery data first"
-                    return
-                if not self._meets_prereqs(tool_name):
-                    self.success = False
-                    self.failure_reason = f"Missing required workflow steps before '{tool_name}'"
-                    return
-                if not self._validate_argument_continuity(tool_name, args):
-                    self.success = False
-                    self.failure_reason = f"Argument continuity check failed for '{tool_name}'"
-                    return
-
-                if self.hit_error:
-                    self.success = True
-                    self.switched_service = True
-                    self.failure_reason = None
-                    if self.verbose:
-                        self._log("RUNNER", f"SUCCESS: Fallback completed via {tool_name}")
-                return
+        required_key = success_keys.get(tool_name)
+        if required_key is None or required_key not in result:
+            return
 
-    def get_tool_schema(self) -> list:
-        """Get tool schema - starts with MCP tools only, adds mounted server tools."""
-        tools = []
+        value = result.get(required_key)
+        if _is_nonactionable(value):
+            self.success = False
+            self.failure_reason = (
+                f"Final tool '{tool_name}' returned non-actionable '{required_key}' value"
+            )
+            return
+        if self.disqualified:
+            self.success = False
+            self.failure_reason = self.disqualify_reason or "Run disqualified by hardening checks"
+            return
+        if self.requires_fresh_resolution:
+            self.success = False
+            self.failure_reason = "Success action used stale context; refresh discovery data first"
+            return
+        if not self._meets_prereqs(tool_name):
+            self.success = False
+            self.failure_reason = f"Missing required workflow steps before '{tool_name}'"
+            return
+        if not self._validate_argument_continuity(tool_name, args):
+            self.success = False
+            self.failure_reason = f"Argument continuity check failed for '{tool_name}'"
+            return
 
-        mcp_tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "mcp_list_servers",
-                    "description": "List all available MCP servers in this category. Call this first to see what servers are available.",
-                    "parameters": {"type": "object", "properties": {}, "required": []},
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "mcp_mount",
-                    "description": "Mount an MCP server to access its tools. You must mount a server before you can use its tools.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {"server_id": {"type": "string", "description": "The ID of the server to mount"}},
-                        "required": ["server_id"],
-                    },
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "mcp_unmount",
-                    "description": "Unmount the current server. Use this before mounting a different server.",
-                    "parameters": {"type": "object", "properties": {}, "required": []},
-                }
-            },
-        ]
-        tools.extend(mcp_tools)
+        if self.hit_error:
+            self.success = True
+            self.switched_service = True
+            self.failure_reason = None
+            if self.verbose:
+                self._log("RUNNER", f"SUCCESS: Fallback completed via {tool_name}")
+
+    def _cached_tool_schema(self) -> list:
+        # A server always mounts the same aliases for this runner, so the schema is
+        # built once per mounted server id (None while unmounted). The result is
+        # shared between turns - only hand out copies of it.
+        cached = self._tool_schema_cache.get(self.mounted_server_id)
+        if cached is not None:
+            return cached
+
+        tools = list(_MCP_TOOL_SCHEMAS)
 
         for name, method in self.mounted_tools.items():
             try:
@@ -940,18 +1098,29 @@ class MCPRunner:
                 }
             })
 
+        self._tool_schema_cache[self.mounted_server_id] = tools
         return tools
 
+    def get_tool_schema(self) -> list:
+        """Get tool schema - starts with MCP tools only, adds mounted server tools."""
+        # Provider SDKs may modify what they are given, so never pass them the cache
+        return copy.deepcopy(self._cached_tool_schema())
+
     def get_anthropic_tools(self) -> list:
         """Convert tool schema to Anthropic format."""
+        cached = self._anthropic_tools_cache.get(self.mounted_server_id)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         tools = []
-        for tool in self.get_tool_schema():
+        for tool in self._cached_tool_schema():
             tools.append({
                 "name": tool["function"]["name"],
                 "description": tool["function"]["description"],
                 "input_schema": tool["function"]["parameters"],
             })
-        return tools
+        self._anthropic_tools_cache[self.mounted_server_id] = tools
+        return copy.deepcopy(tools)
 
     def get_gemini_tools(self):
         """Convert tool schema to Gemini format."""
@@ -981,17 +1150,7 @@ class MCPRunner:
             return self._build_result()
 
     def _run_openai(self, user_prompt: str) -> dict:
-        system_content = (
-            "You are an autonomous tool-execution agent. "
-            "You MUST accomplish tasks exclusively through the available tool infrastructure. "
-            "Do NOT answer from your own knowledge or training data. "
-            "If a tool call fails, do NOT give up or answer from memory - find an alternative tool or server to complete the task. "
-            "You may NOT ask the user follow-up questions. "
-            "You must make reasonable assumptions and complete the task. "
-            "If required information is missing, choose sensible defaults. "
-            "If you are told to login just put default login info to properly login. "
-            "Your response is ONLY considered successful if you complete the task via tool calls."
-        )
+        system_content = _AGENT_SYSTEM_PROMPT
         messages = [
             {"role": "system", "content": system_content},
             {"role": "user", "content": user_prompt}
@@ -1065,7 +1224,7 @@ class MCPRunner:
                         "result": result,
                     })
 
-                    if name in ("mcp_mount", "mcp_unmount"):
+                    if name in _MOUNT_TOOLS:
                         tools = self.get_tool_schema()
 
             else:
@@ -1080,11 +1239,9 @@ class MCPRunner:
 
                 text = (msg.content or "").strip()
                 self.recent_responses.append(text)
-                if len(self.recent_responses) >= self.max_repeats:
-                    last_n = self.recent_responses[-self.max_repeats:]
-                    if all(r == last_n[0] for r in last_n) and last_n[0] != "":
-                        self.failure_reason = "Model stuck in repetition loop"
-                        break
+                if self._is_repeating():
+                    self.failure_reason = "Model stuck in repetition loop"
+                    break
 
                 if self.hit_error and not self.success:
                     self.commentary_after_error_turns += 1
@@ -1107,17 +1264,7 @@ class MCPRunner:
         return self._build_result()
 
     def _run_anthropic(self, user_prompt: str) -> dict:
-        system_content = (
-            "You are an autonomous tool-execution agent. "
-            "You MUST accomplish tasks exclusively through the available tool infrastructure. "
-            "Do NOT answer from your own knowledge or training data. "
-            "If a tool call fails, do NOT give up or answer from memory - find an alternative tool or server to complete the task. "
-            "You may NOT ask the user follow-up questions. "
-            "You must make reasonable assumptions and complete the task. "
-            "If required information is missing, choose sensible defaults. "
-            "If you are told to login just put default login info to properly login. "
-            "Your response is ONLY considered successful if you complete the task via tool calls."
-        )
+        system_content = _AGENT_SYSTEM_PROMPT
 
         messages = [{"role": "user", "content": user_prompt}]
 
@@ -1146,14 +1293,18 @@ class MCPRunner:
             if self.verbose:
                 self._log(f"TURN {turn} - MODEL", response.content)
 
+            # One pass over the blocks: build the echoed assistant message and collect
+            # the text and tool_use blocks handled below.
             assistant_content = []
-            has_tool_use = False
+            text_parts = []
+            tool_use_blocks = []
 
             for block in response.content:
                 if block.type == "text":
                     assistant_content.append({"type": "text", "text": block.text})
+                    text_parts.append(block.text)
                 elif block.type == "tool_use":
-                    has_tool_use = True
+                    tool_use_blocks.append(block)
                     assistant_content.append({
                         "type": "tool_use",
                         "id": block.id,
@@ -1163,35 +1314,34 @@ class MCPRunner:
 
             messages.append({"role": "assistant", "content": assistant_content})
 
-            if has_tool_use:
+            if tool_use_blocks:
                 self.commentary_after_error_turns = 0
                 tool_results = []
                 tool_call_entries = []
 
-                for block in response.content:
-                    if block.type == "tool_use":
-                        name = block.name
-                        args = block.input
-                        tool_call_entries.append({"tool": name, "args": args})
+                for block in tool_use_blocks:
+                    name = block.name
+                    args = block.input
+                    tool_call_entries.append({"tool": name, "args": args})
 
-                        result = self.call_tool(name, args)
+                    result = self.call_tool(name, args)
 
-                        tool_results.append({
-                            "type": "tool_result",
-                            "tool_use_id": block.id,
-                            "content": json.dumps(result),
-                        })
+                    tool_results.append({
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        "content": json.dumps(result),
+                    })
 
-                        self.conversation.append({
-                            "turn": turn,
-                            "role": "tool_result",
-                            "tool": name,
-                            "args": args,
-                            "result": result,
-                        })
+                    self.conversation.append({
+                        "turn": turn,
+                        "role": "tool_result",
+                        "tool": name,
+                        "args": args,
+                        "result": result,
+                    })
 
-                        if name in ("mcp_mount", "mcp_unmount"):
-                            tools = self.get_anthropic_tools()
+                    if name in _MOUNT_TOOLS:
+                        tools = self.get_anthropic_tools()
 
                 self.conversation.append({
                     "turn": turn,
@@ -1203,10 +1353,7 @@ class MCPRunner:
                 messages.append({"role": "user", "content": tool_results})
 
             else:
-                text_content = ""
-                for block in response.content:
-                    if block.type == "text":
-                        text_content += block.text
+                text_content = "".join(text_parts)
 
                 self.conversation.append({
                     "turn": turn,
@@ -1216,11 +1363,9 @@ class MCPRunner:
                 })
 
                 self.recent_responses.append(text_content.strip())
-                if len(self.recent_responses) >= self.max_repeats:
-                    last_n = self.recent_responses[-self.max_repeats:]
-                    if all(r == last_n[0] for r in last_n) and last_n[0] != "":
-                        self.failure_reason = "Model stuck in repetition loop"
-                        break
+                if self._is_repeating():
+                    self.failure_reason = "Model stuck in repetition loop"
+                    break
 
                 if self.hit_error and not self.success:
                     self.commentary_after_error_turns += 1
@@ -1237,7 +1382,7 @@ class MCPRunner:
             if self.success:
                 break
 
-            if response.stop_reason == "end_turn" and not has_tool_use:
+            if response.stop_reason == "end_turn" and not tool_use_blocks:
                 if not (
                     self.hit_error
                     and not self.success
@@ -1253,17 +1398,7 @@ class MCPRunner:
     def _run_gemini(self, user_prompt: str) -> dict:
         import google.generativeai as genai
 
-        system_content = (
-            "You are an autonomous tool-execution agent. "
-            "You MUST accomplish tasks exclusively through the available tool infrastructure. "
-            "Do NOT answer from your own knowledge or training data. "
-            "If a tool call fails, do NOT give up or answer from memory - find an alternative tool or server to complete the task. "
-            "You may NOT ask the user follow-up questions. "
-            "You must make reasonable assumptions and complete the task. "
-            "If required information is missing, choose sensible defaults. "
-            "If you are told to login just put default login info to properly login. "
-            "Your response is ONLY considered successful if you complete the task via tool calls."
-        )
+        system_content = _AGENT_SYSTEM_PROMPT
 
         self.conversation.append({"turn": 0, "role": "system", "content": system_content})
         self.conversation.append({"turn": 0, "role": "user", "content": user_prompt})
@@ -1303,8 +1438,11 @@ class MCPRunner:
             has_function_call = False
             function_responses = []
             tool_call_entries = []
+            text_parts = []
 
             for part in candidate.content.parts:
+                if hasattr(part, 'text') and part.text:
+                    text_parts.append(part.text)
                 if hasattr(part, 'function_call') and part.function_call:
                     has_function_call = True
                     fc = part.function_call
@@ -1341,10 +1479,7 @@ class MCPRunner:
                 })
                 current_message = function_responses
             else:
-                text_content = ""
-                for part in candidate.content.parts:
-                    if hasattr(part, 'text') and part.text:
-                        text_content += part.text
+                text_content = "".join(text_parts)
 
                 self.conversation.append({
                     "turn": turn,
@@ -1354,11 +1489,9 @@ class MCPRunner:
                 })
 
                 self.recent_responses.append(text_content.strip())
-                if len(self.recent_responses) >= self.max_repeats:
-                    last_n = self.recent_responses[-self.max_repeats:]
-                    if all(r == last_n[0] for r in last_n) and last_n[0] != "":
-                        self.failure_reason = "Model stuck in repetition loop"
-                        break
+                if self._is_repeating():
+                    self.failure_reason = "Model stuck in repetition loop"
+                    break
 
                 if self.hit_error and not self.success:
                     self.commentary_after_error_turns += 1
@@ -1392,7 +1525,7 @@ class MCPRunner:
             "hit_error": self.hit_error,
             "switched_service": self.switched_service,
             "failure_reason": self.failure_reason,
-            "trace": self.trace,
+            "trace": [record._asdict() for record in self.trace],
             "conversation": self.conversation,
         }
 